@@ -6,27 +6,38 @@ Provides a unified interface for all client operations across different environm
 import argparse
 import sys
 import os
+import re
 import logging
-from typing import List
-from src.eagleview.config import create_config
-from src.eagleview.client import create_client
-from src.eagleview.services import PropertyDataService
-from src.eagleview.services.base.imagery_service import ImageryService
-from src.eagleview.services.base.image_download_service import ImageDownloadService
-from src.eagleview.utils.file_ops import setup_logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
+from src.eagleview.utils.file_ops import read_json_file, setup_logging
 
-def main():
-    """Main CLI entry point."""
+# The client and services pull in requests and friends; they are imported
+# inside the operations that need them so --help stays fast.
+if TYPE_CHECKING:
+    from src.eagleview.services.base.imagery_service import ImageryService
+
+OPERATIONS = ('property-data', 'property-results', 'imagery', 'download-images', 'download-reports', 'demo')
+ENVIRONMENTS = ('sandbox', 'production')
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+# Credentials are read when main() runs, not at import, so callers that set
+# them after importing this module are still honoured
+CLIENT_ID_ENV = 'EAGLEVIEW_CLIENT_ID'
+CLIENT_SECRET_ENV = 'EAGLEVIEW_CLIENT_SECRET'
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(description="EagleView API Client")
     parser.add_argument(
-        '--operation', 
-        choices=['property-data', 'property-results', 'imagery', 'download-images', 'download-reports', 'demo'],
+        '--operation',
+        choices=OPERATIONS,
         required=True,
         help='Operation to perform'
     )
     parser.add_argument(
         '--environment',
-        choices=['sandbox', 'production'],
+        choices=ENVIRONMENTS,
         default='sandbox',
         help='Environment to use (default: sandbox)'
     )
@@ -43,7 +54,7 @@ def main():
     parser.add_argument(
         '--log-level',
         default='INFO',
-        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        choices=LOG_LEVELS,
         help='Logging level'
     )
     parser.add_argument(
@@ -54,12 +65,42 @@ def main():
         '--property-data-file',
         help='Path to property data JSON file for image download operation'
     )
-    
-    args = parser.parse_args()
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=16,
+        help='Maximum number of concurrent API requests (default: 16, 1 disables batching)'
+    )
+    parser.add_argument(
+        '--download-workers',
+        type=int,
+        default=4,
+        help='Number of images to download concurrently (default: 4)'
+    )
+    return parser
+
+# A "lat,lon" pair of decimal numbers, optionally padded with whitespace
+_COORD_RE = re.compile(
+    r'\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+))\s*,\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+))\s*'
+)
+
+# Fixed demo workload
+_DEMO_PROD_COORDS = ({"lat": 40.7128, "lon": -74.0060},)  # Example: New York City
+_DEMO_NAMES = ("demo_location_1",)
+
+# Built once at import so repeated main() calls reuse the same parser
+_PARSER = _build_parser()
+
+def main():
+    """Main CLI entry point."""
+    args = _PARSER.parse_args()
     
     # Setup logging
     logger = setup_logging(__name__, args.log_level)
     
+    from src.eagleview.config import create_config
+    from src.eagleview.client import create_client
+    
     # Load configuration based on environment
     if args.config:
         # Load from config file
@@ -69,12 +110,12 @@ def main():
         # Create environment-appropriate configuration
         settings = create_config(
             environment=args.environment,
-            client_id=os.getenv('EAGLEVIEW_CLIENT_ID'),
-            client_secret=os.getenv('EAGLEVIEW_CLIENT_SECRET')
+            client_id=os.environ.get(CLIENT_ID_ENV),
+            client_secret=os.environ.get(CLIENT_SECRET_ENV)
         )
     
-    if not settings.validate():
-        logger.error("Missing required configuration. Set EAGLEVIEW_CLIENT_ID and EAGLEVIEW_CLIENT_SECRET environment variables or provide a configuration file.")
+    if not settings.is_valid:
+        logger.error(f"Missing required configuration. Set {CLIENT_ID_ENV} and {CLIENT_SECRET_ENV} environment variables or provide a configuration file.")
         sys.exit(1)
     
     # Create client
@@ -82,9 +123,15 @@ def main():
     
     # Process based on operation
     if args.operation == 'property-data':
+        from src.eagleview.services import PropertyDataService
         service = PropertyDataService(client)
         coordinates = parse_coordinates(args.coordinates) if args.coordinates else service.get_sandbox_coordinates()
-        requests_data = service.submit_coordinates_requests(coordinates)
+        if args.max_concurrency > 1:
+            requests_data = service.submit_coordinates_requests_batched(
+                coordinates, concurrency=args.max_concurrency
+            )
+        else:
+            requests_data = service.submit_coordinates_requests(coordinates)
         if requests_data:
             # For property data requests, don't override the service's default directory
             output_dir = args.output_dir if args.output_dir != 'data' else None
@@ -98,61 +145,59 @@ def main():
         from scripts.download_reports import main as download_reports_main
         download_reports_main()
     elif args.operation == 'imagery':
+        from src.eagleview.services.base.imagery_service import ImageryService
         service = ImageryService(client)
         # For imagery, we need coordinates or addresses
-        coordinates = parse_coordinates(args.coordinates) if args.coordinates else service.get_sandbox_coordinates()
-        for i, coord in enumerate(coordinates):
-            name = f"location_{i+1}"
-            lat = coord["lat"]
-            lon = coord["lon"]
-            imagery_data = service.request_imagery_for_location(name, lat, lon)
-            if imagery_data:
-                # For imagery operations, don't override the service's default directory
-                output_dir = args.output_dir if args.output_dir != 'data' else None
-                service.save_imagery_data(imagery_data, name, lat, lon, output_dir)
+        if args.coordinates:
+            pairs = iter_coordinate_pairs(args.coordinates)
+        else:
+            pairs = ((coord["lat"], coord["lon"]) for coord in service.get_sandbox_coordinates())
+        # For imagery operations, don't override the service's default directory
+        output_dir = args.output_dir if args.output_dir != 'data' else None
+        # Each request is a blocking HTTPS round-trip, so overlap them with threads.
+        # Coordinates are parsed as they are submitted rather than collected first.
+        with ThreadPoolExecutor(max_workers=max(1, args.max_concurrency)) as executor:
+            futures = [
+                executor.submit(_fetch_one, service, i, lat, lon, output_dir)
+                for i, (lat, lon) in enumerate(pairs)
+            ]
+            for future in as_completed(futures):
+                future.result()
     elif args.operation == 'download-images':
+        from src.eagleview.services.base.image_download_service import ImageDownloadService
         service = ImageDownloadService(client)
         # For download-images, we need property data results
         property_data_file = args.property_data_file
         
         if not property_data_file:
-            # Try to find a property data file
-            import glob
-            # Look for recent property data files
-            data_dir = args.output_dir
-            property_data_pattern = os.path.join(data_dir, "property_results", "*property_data_result*.json")
-            property_data_files = glob.glob(property_data_pattern)
+            # Look for the most recent property data file
+            property_data_file = find_latest_property_data_file(args.output_dir)
             
-            if property_data_files:
-                # Sort by modification time, newest first
-                property_data_files.sort(key=os.path.getmtime, reverse=True)
-                property_data_file = property_data_files[0]
-                print(f"Using property data file: {property_data_file}")
+            if property_data_file:
+                logger.info(f"Using property data file: {property_data_file}")
             else:
-                print("No property data files found.")
-                print("Please run property-data operation first or provide --property-data-file")
+                logger.warning("No property data files found. "
+                               "Please run property-data operation first or provide --property-data-file")
                 return
         
         # Load property data
         try:
-            import json
-            with open(property_data_file, 'r') as f:
-                property_data = json.load(f)
-            print(f"Loaded property data from: {property_data_file}")
+            property_data = read_json_file(property_data_file)
+            logger.info(f"Loaded property data from: {property_data_file}")
         except Exception as e:
-            print(f"Failed to load property data: {e}")
+            logger.error(f"Failed to load property data: {e}")
             return
         
         # Download images
-        print("Downloading property images...")
+        logger.info("Downloading property images...")
         try:
-            count = service.download_property_images(property_data, "downloaded_images")
-            print(f"Downloaded {count} images successfully!")
-            print("Images saved to: data/imagery/downloaded_images/")
+            count = service.download_property_images(
+                property_data, "downloaded_images", max_workers=args.download_workers
+            )
+            logger.info(f"Downloaded {count} images successfully!")
+            logger.info("Images saved to: data/imagery/downloaded_images/")
         except Exception as e:
-            print(f"Failed to download images: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Failed to download images: {e}")
     elif args.operation == 'demo':
         print("EagleView API Client Demo")
         print("=" * 40)
@@ -161,56 +206,132 @@ def main():
         # Run complete workflow
         run_demo(client, args.output_dir, settings)
 
-def parse_coordinates(coord_strings: List[str]) -> List[dict]:
-    """Parse coordinate strings into coordinate dictionaries."""
-    coordinates = []
+def find_latest_property_data_file(data_dir: str) -> Optional[str]:
+    """Find the most recently modified property data result file.
+    
+    Args:
+        data_dir: Data directory containing the property_results folder
+        
+    Returns:
+        Path to the newest matching file, or None if there are none
+    """
+    results_dir = os.path.join(data_dir, "property_results")
+    try:
+        with os.scandir(results_dir) as entries:
+            # DirEntry caches its stat result, so each file is stat'ed once
+            latest = max(
+                (entry for entry in entries
+                 if "property_data_result" in entry.name and entry.name.endswith(".json")
+                 and entry.is_file()),
+                key=lambda entry: entry.stat().st_mtime,
+                default=None
+            )
+    except FileNotFoundError:
+        return None
+    return latest.path if latest else None
+
+def iter_coordinate_pairs(coord_strings: Iterable[str]) -> Iterator[Tuple[float, float]]:
+    """Lazily parse coordinate strings into (lat, lon) tuples.
+    
+    Args:
+        coord_strings: Coordinates in format "lat,lon"
+        
+    Yields:
+        (latitude, longitude) tuples; invalid entries are logged and skipped
+    """
+    match = _COORD_RE.fullmatch
     for coord_str in coord_strings:
-        try:
-            lat, lon = map(float, coord_str.split(','))
-            coordinates.append({"lat": lat, "lon": lon})
-        except ValueError:
+        m = match(coord_str)
+        if m:
+            yield float(m.group(1)), float(m.group(2))
+        else:
             logging.warning(f"Invalid coordinate format: {coord_str}")
-    return coordinates
+
+def iter_coordinates(coord_strings: Iterable[str]) -> Iterator[dict]:
+    """Lazily parse coordinate strings into coordinate dictionaries."""
+    for lat, lon in iter_coordinate_pairs(coord_strings):
+        yield {"lat": lat, "lon": lon}
+
+def parse_coordinates(coord_strings: List[str]) -> List[dict]:
+    """Parse coordinate strings into coordinate dictionaries."""
+    return list(iter_coordinates(coord_strings))
+
+def _fetch_one(service: 'ImageryService', index: int, lat: float, lon: float,
+               output_dir: str = None) -> bool:
+    """Request imagery for a single coordinate and save it.
+    
+    Args:
+        service: ImageryService used for the request
+        index: Position of the coordinate in the input list
+        lat: Latitude coordinate
+        lon: Longitude coordinate
+        output_dir: Directory to save the file (None for the service default)
+        
+    Returns:
+        True if imagery was retrieved and saved, False otherwise
+    """
+    name = f"location_{index+1}"
+    imagery_data = service.request_imagery_for_location(name, lat, lon)
+    if imagery_data:
+        return service.save_imagery_data(imagery_data, name, lat, lon, output_dir)
+    return False
 
 def run_demo(client, output_dir: str, settings):
-    """Run the complete demo workflow."""
+    """Run the complete demo workflow.
+    
+    The property data and imagery steps don't depend on each other, so they
+    run concurrently; each step's messages are printed together, in step order.
+    """
+    from src.eagleview.services import PropertyDataService
+    from src.eagleview.services.base.imagery_service import ImageryService
+    
     logging.info("Starting demo workflow...")
     
-    # 1. Property data requests
-    print("1. Submitting property data requests...")
     property_service = PropertyDataService(client)
     coordinates = property_service.get_sandbox_coordinates()
     
     # In production environment, get different coordinates if needed
     if settings.environment == 'production':
         # Use generic coordinates for production (user would need to provide real ones)
-        coordinates = [{"lat": 40.7128, "lon": -74.0060}]  # Example: New York City
-    
-    requests_data = property_service.submit_coordinates_requests(coordinates)
-    if requests_data:
-        # For property data requests in demo, don't override the service's default directory
-        requests_output_dir = output_dir if output_dir != 'data' else None
-        property_service.save_requests_data(requests_data, requests_output_dir)
-        print(f"   Submitted {len(requests_data)} property data requests")
-    
-    # 2. Imagery requests
-    print("2. Requesting imagery...")
-    imagery_service = ImageryService(client)
-    for i, coord in enumerate(coordinates[:1]):  # Just first coordinate for demo
-        name = f"demo_location_{i+1}"
-        lat = coord["lat"]
-        lon = coord["lon"]
-        
-        # Validate coordinates if needed based on settings
-        try:
-            imagery_data = imagery_service.request_imagery_for_location(name, lat, lon)
-            if imagery_data:
-                # For imagery operations in demo, don't override the service's default directory
-                imagery_output_dir = output_dir if output_dir != 'data' else None
-                imagery_service.save_imagery_data(imagery_data, name, lat, lon, imagery_output_dir)
-                print(f"   Retrieved imagery for {name}")
-        except ValueError as e:
-            print(f"   Skipped imagery for {name}: {e}")
+        coordinates = [dict(coord) for coord in _DEMO_PROD_COORDS]
+    
+    def property_data_step() -> List[str]:
+        # 1. Property data requests
+        lines = ["1. Submitting property data requests..."]
+        # Coordinates are submitted concurrently; the client's rate limiter paces them
+        requests_data = property_service.submit_coordinates_requests_batched(coordinates)
+        if requests_data:
+            # For property data requests in demo, don't override the service's default directory
+            requests_output_dir = output_dir if output_dir != 'data' else None
+            property_service.save_requests_data(requests_data, requests_output_dir)
+            lines.append(f"   Submitted {len(requests_data)} property data requests")
+        return lines
+    
+    def imagery_step() -> List[str]:
+        # 2. Imagery requests
+        lines = ["2. Requesting imagery..."]
+        imagery_service = ImageryService(client)
+        if coordinates:  # Just first coordinate for demo
+            name = _DEMO_NAMES[0]
+            lat = coordinates[0]["lat"]
+            lon = coordinates[0]["lon"]
+            
+            # Validate coordinates if needed based on settings
+            try:
+                imagery_data = imagery_service.request_imagery_for_location(name, lat, lon)
+                if imagery_data:
+                    # For imagery operations in demo, don't override the service's default directory
+                    imagery_output_dir = output_dir if output_dir != 'data' else None
+                    imagery_service.save_imagery_data(imagery_data, name, lat, lon, imagery_output_dir)
+                    lines.append(f"   Retrieved imagery for {name}")
+            except ValueError as e:
+                lines.append(f"   Skipped imagery for {name}: {e}")
+        return lines
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        steps = [executor.submit(property_data_step), executor.submit(imagery_step)]
+        for step in steps:
+            print("\n".join(step.result()))
     
     print("Demo workflow completed!")
 
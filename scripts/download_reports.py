@@ -1,51 +1,82 @@
 """
 Script to download EagleView reports and related files using the Measurement Order API.
 This script implements report downloading functionality using the /v1/File/GetReportFile
-and /v3/Report/{reportId}/file-links endpoints.
+endpoint.
 """
 
-import json
+import hashlib
 import os
-import requests
-import time
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
 from src.eagleview.config.base import EagleViewSettings
-from src.eagleview.client.base import EagleViewClient
-from src.eagleview.utils.file_ops import setup_logging, ensure_directory_exists, get_data_directory
+from src.eagleview.client.base import DOWNLOAD_CHUNK_SIZE, EagleViewClient
+from src.eagleview.utils.file_ops import (setup_logging, dumps_json_line, ensure_directory_exists,
+                                         extension_for_content_type, generate_timestamped_filename,
+                                         get_data_directory)
 
 logger = setup_logging(__name__)
 
+# Reports downloaded at once; the client's rate limiter still paces every request
+REPORT_DOWNLOAD_WORKERS = 8
 
-def get_report_file_links(client: EagleViewClient, report_id: int) -> Dict:
+# File extension for each report media type; anything else is saved as .dat
+REPORT_EXTENSION_BY_TYPE = {
+    'application/pdf': '.pdf',
+    'application/json': '.json',
+    'application/xml': '.xml',
+    'text/xml': '.xml',
+    'application/zip': '.zip',
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+}
+
+# Every extension a report file can be saved with
+REPORT_FILE_EXTENSIONS = tuple(dict.fromkeys([*REPORT_EXTENSION_BY_TYPE.values(), '.dat']))
+
+
+class DownloadSummary:
     """
-    Get file download links for a specific report using the file-links endpoint.
+    Append-only JSON Lines record of the report files downloaded in a run.
     
-    Args:
-        client: Authenticated EagleViewClient
-        report_id: Report ID to get file links for
-        
-    Returns:
-        Dictionary containing file download links
+    Each record is flushed as soon as it is written, so the summary survives an
+    interrupted run and never has to be held in memory. The file is only created
+    once the first record arrives. Safe to share between download threads.
     """
-    try:
-        # Use the client's make_request method but target the reports API
-        # The base URL may need to be different for reports
-        endpoint = f'/v3/Report/{report_id}/file-links'
-        response = client.make_request('GET', endpoint, use_imagery_base=False)  # Using main base URL for reports
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            logger.warning(f"Failed to get file links for report {report_id}: {response.status_code}")
-            logger.warning(f"Response: {response.text}")
-            return {}
-    except Exception as e:
-        logger.error(f"Error getting file links for report {report_id}: {e}")
-        return {}
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path of the JSON Lines file to append to
+        """
+        self.path = path
+        self.count = 0
+        self._file = None
+        self._lock = threading.Lock()
+    
+    def record(self, entry: Dict):
+        """Append one record to the summary."""
+        line = dumps_json_line(entry)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'ab')
+            self._file.write(line)
+            self._file.flush()
+            self.count += 1
+    
+    def close(self):
+        """Close the summary file if it was opened."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
 
 
 def download_report_file(client: EagleViewClient, report_id: int, file_type: Optional[int] = None, 
-                        file_format: Optional[int] = None, output_dir: str = None) -> bool:
+                        file_format: Optional[int] = None, output_dir: str = None,
+                        summary: Optional[DownloadSummary] = None) -> bool:
     """
     Download a specific report file using the GetReportFile endpoint.
     
@@ -55,100 +86,96 @@ def download_report_file(client: EagleViewClient, report_id: int, file_type: Opt
         file_type: File type to download (optional)
         file_format: File format to download (optional)
         output_dir: Directory to save the file (optional)
+        summary: Summary to record the downloaded file in (optional)
         
     Returns:
-        True if download was successful, False otherwise
+        True if download was successful or the file was already downloaded, False otherwise
     """
     if output_dir is None:
         output_dir = get_data_directory("property_reports")
         ensure_directory_exists(output_dir)
     
+    # The file name depends only on the request, so it is known before downloading
+    filename = f"report_{report_id}"
+    if file_type is not None:
+        filename += f"_type_{file_type}"
+    if file_format is not None:
+        filename += f"_format_{file_format}"
+    file_prefix = os.path.join(output_dir, filename)
+    
+    # Skip files an earlier run finished; unfinished ones are still named .part
+    for extension in REPORT_FILE_EXTENSIONS:
+        existing = file_prefix + extension
+        try:
+            if os.path.getsize(existing) > 0:
+                logger.info(f"Report file already downloaded, skipping: {existing}")
+                return True
+        except OSError:
+            continue
+    
+    logger.info(f"Downloading report {report_id}")
     try:
-        # Build the endpoint with query parameters
-        endpoint = f'/v1/File/GetReportFile?reportId={report_id}'
-        if file_type is not None:
-            endpoint += f'&fileType={file_type}'
-        if file_format is not None:
-            endpoint += f'&fileFormat={file_format}'
-        
-        # Get access token
-        token = client.get_access_token()
-        
-        # Prepare headers for direct request (not using make_request to handle binary response)
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/json'  # This might need to be different for binary files
-        }
-        
-        # Make request to download file
-        # Note: This endpoint might return binary data, so we need to handle it specially
-        base_url = client.base_url
-        url = f"{base_url}{endpoint}"
-        
-        logger.info(f"Making request to: {url}")
-        
-        response = requests.get(url, headers=headers)
-        
-        if response.status_code == 200:
-            # Determine file extension based on content type or default to .pdf
-            content_type = response.headers.get('Content-Type', 'application/octet-stream')
-            
-            if 'pdf' in content_type.lower():
-                extension = '.pdf'
-            elif 'json' in content_type.lower():
-                extension = '.json'
-            elif 'xml' in content_type.lower():
-                extension = '.xml'
-            elif 'jpeg' in content_type.lower() or 'jpg' in content_type.lower():
-                extension = '.jpg'
-            elif 'png' in content_type.lower():
-                extension = '.png'
+        # Stream the response so the file is never held in memory in full
+        with client.open_report_file(report_id, file_type, file_format) as response:
+            if response.status_code == 200:
+                # Determine file extension based on content type
+                extension = extension_for_content_type(response.headers.get('Content-Type'),
+                                                       REPORT_EXTENSION_BY_TYPE, '.dat')
+                
+                filepath = file_prefix + extension
+                
+                # Write the binary content to file as it arrives, under a temporary
+                # name so an interrupted download never looks like a finished one
+                tmp_filepath = f"{filepath}.part"
+                size_bytes = 0
+                # Hash each chunk as it is written so the file never has to be read back
+                digest = hashlib.sha256()
+                with open(tmp_filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        digest.update(chunk)
+                        size_bytes += f.write(chunk)
+                os.replace(tmp_filepath, filepath)
+                
+                sha256 = digest.hexdigest()
+                logger.info(f"Successfully downloaded report file to: {filepath} "
+                            f"({size_bytes} bytes, sha256 {sha256})")
+                if summary is not None:
+                    summary.record({
+                        'report_id': report_id,
+                        'file_type': file_type,
+                        'file_format': file_format,
+                        'filename': os.path.basename(filepath),
+                        'size_bytes': size_bytes,
+                        'sha256': sha256,
+                        'downloaded_at': datetime.now().isoformat(timespec='seconds'),
+                    })
+                return True
             else:
-                extension = '.dat'  # Default extension
-            
-            # Create filename
-            filename = f"report_{report_id}"
-            if file_type is not None:
-                filename += f"_type_{file_type}"
-            if file_format is not None:
-                filename += f"_format_{file_format}"
-            filename += extension
-            
-            filepath = os.path.join(output_dir, filename)
-            
-            # Write the binary content to file
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-            
-            logger.info(f"Successfully downloaded report file to: {filepath}")
-            return True
-        else:
-            logger.warning(f"Failed to download report file for report {report_id}: {response.status_code}")
-            logger.warning(f"Response: {response.text}")
-            return False
+                logger.warning(f"Failed to download report file for report {report_id}: {response.status_code}")
+                # Log only the start of the body instead of reading the whole stream
+                preview = next(response.iter_content(chunk_size=200), b'')
+                logger.warning(f"Response: {preview.decode('utf-8', errors='replace')}")
+                return False
             
     except Exception as e:
         logger.error(f"Error downloading report file for report {report_id}: {e}")
         return False
 
 
-def get_customer_reports(client: EagleViewClient) -> List[Dict]:
+def iter_customer_report_pages(client: EagleViewClient) -> Iterator[List[Dict]]:
     """
-    Get all customer reports to identify available report IDs for download.
+    Yield customer reports page by page to identify report IDs for download.
     
     Args:
         client: Authenticated EagleViewClient
         
-    Returns:
-        List of report dictionaries
+    Yields:
+        Lists of report dictionaries; a failed listing is logged and ends the iteration
     """
     try:
-        # Get all customer reports to identify which ones we can download
-        all_reports = client.get_all_customer_reports(save_to_csv=False)
-        return all_reports
+        yield from client.iter_customer_report_pages()
     except Exception as e:
         logger.error(f"Error getting customer reports: {e}")
-        return []
 
 
 def main():
@@ -167,51 +194,54 @@ def main():
     # Create client
     client = EagleViewClient(settings)
     
-    # Get available reports
+    # Resolve and create the output directory once for the whole batch
+    output_dir = get_data_directory("property_reports")
+    ensure_directory_exists(output_dir)
+    summary = DownloadSummary(os.path.join(
+        output_dir, generate_timestamped_filename("downloaded_reports_summary", ".jsonl")))
+    
+    # Reports are listed page by page and each page's reports start downloading
+    # while the next pages are still being fetched
     print("\n1. Fetching available reports...")
-    reports = get_customer_reports(client)
+    report_count = 0
+    seen_ids = set()
+    downloads = []
+    try:
+        with ThreadPoolExecutor(max_workers=REPORT_DOWNLOAD_WORKERS) as executor:
+            for report_list in iter_customer_report_pages(client):
+                # A report listed twice (e.g. when the listing shifts between pages) is downloaded
+                # once; two workers writing the same file would also clobber each other's .part file
+                for i, report in enumerate(report_list, report_count):
+                    report_id = report.get('Id') or report.get('reportId')
+                    if not report_id:
+                        logger.warning(f"Report {i+1} has no report ID")
+                    elif report_id not in seen_ids:
+                        seen_ids.add(report_id)
+                        # Files already on disk are skipped before any request is made
+                        downloads.append(executor.submit(download_report_file, client, report_id,
+                                                         output_dir=output_dir, summary=summary))
+                report_count += len(report_list)
+            
+            # Reports listed more than once are counted (and downloaded) once
+            if report_count:
+                print(f"Found {len(seen_ids)} report(s) in your account")
+                print(f"\n2. Downloading reports...")
+            download_count = sum(download.result() for download in downloads)
+    finally:
+        summary.close()
     
-    if not reports:
+    if not report_count:
         print("No reports found in your account.")
         print("Reports can only be downloaded after they are ordered using the Measurement Order API.")
         return
     
-    print(f"Found {len(reports)} report(s) in your account")
-    
-    # Download reports
-    print(f"\n2. Downloading reports...")
-    download_count = 0
-    
-    for i, report in enumerate(reports):
-        report_id = report.get('Id') or report.get('reportId')
-        if report_id:
-            logger.info(f"[{i+1}/{len(reports)}] Downloading report {report_id}")
-            
-            # Try to get file links first (this gives us the download URLs)
-            file_links = get_report_file_links(client, report_id)
-            
-            if file_links:
-                logger.info(f"  Found {len(file_links.get('Links', []))} file links for report {report_id}")
-                
-                # If we have specific file links, we could download them here
-                # For now, let's try the GetReportFile endpoint
-                success = download_report_file(client, report_id)
-                if success:
-                    download_count += 1
-            else:
-                # Try to download directly without specific file type/format
-                success = download_report_file(client, report_id)
-                if success:
-                    download_count += 1
-        else:
-            logger.warning(f"Report {i+1} has no report ID")
-    
     print(f"\n{'='*40}")
     print("PROCESS COMPLETED!")
-    print(f"Downloaded {download_count} out of {len(reports)} reports")
+    print(f"Downloaded {download_count} out of {len(seen_ids)} reports")
     print("Files saved to data/reports/ directory")
+    if summary.count:
+        print(f"Download summary written to {summary.path}")
     print("="*40)
 
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,16 +4,32 @@ This fills the gap in the existing functionality to retrieve actual property dat
 after submitting initial requests.
 """
 
-import json
 import os
+import random
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from src.eagleview.config.base import EagleViewSettings
-from src.eagleview.client.base import EagleViewClient
-from src.eagleview.utils.file_ops import setup_logging, save_json_data, get_data_directory
+from src.eagleview.client.base import EagleViewClient, is_result_in_progress
+from src.eagleview.utils.file_ops import (setup_logging, save_json_data, get_data_directory, loads_json,
+                                         ensure_directory_exists)
 
 logger = setup_logging(__name__)
 
+# Polling of in-progress requests: attempts per request, backoff bounds in seconds,
+# and how many requests are polled at once
+POLL_MAX_ATTEMPTS = 10
+POLL_INITIAL_DELAY = 2
+POLL_MAX_DELAY = 60
+POLL_WORKERS = 16
+
+# Result files written at once
+SAVE_WORKERS = 8
+
+# Request files read at once
+LOAD_WORKERS = 8
+
 
 def load_request_files(requests_dir: str = None) -> List[Dict]:
     """
@@ -32,24 +48,38 @@ def load_request_files(requests_dir: str = None) -> List[Dict]:
         logger.warning(f"Requests directory does not exist: {requests_dir}")
         return []
     
+    with os.scandir(requests_dir) as entries:
+        # is_file() uses the type scandir already read, so no extra stat call
+        paths = [entry.path for entry in entries
+                 if entry.name.endswith('.json') and 'request' in entry.name and entry.is_file()]
+    if not paths:
+        return []
+    
+    # Read and parse the files concurrently so their I/O overlaps
+    with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(paths))) as executor:
+        loaded = list(executor.map(_read_request_file, paths))
+    
     request_files = []
-    for filename in os.listdir(requests_dir):
-        if filename.endswith('.json') and 'request' in filename:
-            filepath = os.path.join(requests_dir, filename)
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        request_files.extend(data)  # Add individual requests
-                    else:
-                        request_files.append(data)  # Add single request
-                logger.info(f"Loaded requests from {filename}")
-            except Exception as e:
-                logger.error(f"Error loading {filename}: {e}")
+    for data in loaded:
+        if isinstance(data, list):
+            request_files.extend(data)  # Add individual requests
+        elif data is not None:
+            request_files.append(data)  # Add single request
+    logger.info(f"Loaded {len(request_files)} requests from {len(paths)} request files")
     
     return request_files
 
 
+def _read_request_file(path: str):
+    """Read and parse one request file, logging and returning None on failure."""
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            return loads_json(f.read())
+    except Exception as e:
+        logger.error(f"Error loading {os.path.basename(path)}: {e}")
+        return None
+
+
 def get_request_ids(request_data: List[Dict]) -> List[str]:
     """
     Extract request IDs from request data.
@@ -62,17 +92,63 @@ def get_request_ids(request_data: List[Dict]) -> List[str]:
     """
     request_ids = []
     for request in request_data:
-        if 'request' in request and 'id' in request['request']:
-            request_ids.append(request['request']['id'])
+        # Look the nested request up once instead of testing and indexing it again
+        inner = request.get('request')
+        if inner is not None and 'id' in inner:
+            request_ids.append(inner['id'])
         elif 'id' in request:
             request_ids.append(request['id'])
     return request_ids
 
 
+def poll_property_result(client: EagleViewClient, request_id: str, index: int, total: int) -> Dict:
+    """
+    Poll a single property data request until it is no longer in progress.
+    
+    Waits between polls with exponential backoff and jitter, starting at
+    POLL_INITIAL_DELAY seconds and capped at POLL_MAX_DELAY.
+    
+    Args:
+        client: Authenticated EagleViewClient
+        request_id: Request ID to fetch the result for
+        index: Position of the request ID in the batch
+        total: Number of request IDs in the batch (for logging)
+        
+    Returns:
+        The latest result, or an empty dictionary if it could not be retrieved
+    """
+    logger.info(f"[{index+1}/{total}] Fetching result for request ID: {request_id}")
+    
+    delay = POLL_INITIAL_DELAY
+    result = {}
+    for attempt in range(POLL_MAX_ATTEMPTS):
+        result = client.get_property_data_result(request_id)
+        if not result:
+            logger.warning(f"  Failed to retrieve result for request {request_id}")
+            return {}
+        
+        status = result.get('status', result.get('request', {}).get('status', 'Unknown'))
+        if not is_result_in_progress(result):
+            logger.info(f"  Retrieved result for request {request_id}, status: {status}")
+            return result
+        
+        if attempt < POLL_MAX_ATTEMPTS - 1:
+            logger.info(f"  Request {request_id} still in progress, status: {status}. Waiting {delay}s...")
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * 2, POLL_MAX_DELAY)
+    
+    # Attempts exhausted and still no complete result
+    logger.warning(f"  Max attempts reached for request {request_id}, saving latest result")
+    return result
+
+
 def fetch_property_results(settings: EagleViewSettings, request_ids: List[str]) -> Dict[str, Dict]:
     """
     Fetch property data results for the given request IDs.
     
+    Requests are polled concurrently, so requests that are still processing
+    wait alongside each other instead of one after another.
+    
     Args:
         settings: EagleView configuration settings
         request_ids: List of request IDs to fetch results for
@@ -81,41 +157,16 @@ def fetch_property_results(settings: EagleViewSettings, request_ids: List[str])
         Dictionary mapping request IDs to their results
     """
     client = EagleViewClient(settings)
-    results = {}
-    
-    for i, request_id in enumerate(request_ids):
-        logger.info(f"[{i+1}/{len(request_ids)}] Fetching result for request ID: {request_id}")
-        
-        # Retry loop for requests that are still processing
-        max_attempts = 10
-        attempt = 0
-        
-        while attempt < max_attempts:
-            result = client.get_property_data_result(request_id)
-            
-            if result:
-                # Check if the request is still processing
-                status = result.get('status', result.get('request', {}).get('status', 'Unknown'))
-                
-                if status == 'In Progress' or ('In Progress' in str(result.get('request', {}).get('status', ''))):
-                    logger.info(f"  Request {request_id} still in progress, status: {status}. Waiting...")
-                    time.sleep(30)  # Wait 30 seconds before trying again
-                    attempt += 1
-                else:
-                    logger.info(f"  Retrieved result for request {request_id}, status: {status}")
-                    results[request_id] = result
-                    break
-            else:
-                logger.warning(f"  Failed to retrieve result for request {request_id}")
-                results[request_id] = {}
-                break
-        
-        # If we've exhausted attempts and still have no complete result
-        if attempt == max_attempts:
-            logger.warning(f"  Max attempts reached for request {request_id}, saving latest result")
-            results[request_id] = result if result else {}
-    
-    return results
+    total = len(request_ids)
+    if not total:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(POLL_WORKERS, total)) as executor:
+        results = executor.map(
+            lambda item: poll_property_result(client, item[1], item[0], total),
+            enumerate(request_ids)
+        )
+        return dict(zip(request_ids, results))
 
 
 def save_property_results(results: Dict[str, Dict], output_dir: str = None):
@@ -128,28 +179,35 @@ def save_property_results(results: Dict[str, Dict], output_dir: str = None):
     """
     if output_dir is None:
         output_dir = get_data_directory("property_results")
+    ensure_directory_exists(output_dir)
     
+    jobs = []
     for request_id, result in results.items():
         if result:  # Only save if there's actual result data
             filename = f"property_data_result_{request_id}.json"
-            filepath = os.path.join(output_dir, filename)
-            save_json_data(result, filepath)
-            logger.info(f"Saved property data result to: {filepath}")
+            jobs.append((result, os.path.join(output_dir, filename)))
         else:
             logger.warning(f"No result data to save for request ID: {request_id}")
+    if not jobs:
+        return
+    
+    # Each file is serialized and written in one call; write several at once
+    with ThreadPoolExecutor(max_workers=min(SAVE_WORKERS, len(jobs))) as executor:
+        executor.map(lambda job: save_json_data(job[0], job[1], create_dirs=False), jobs)
 
 
 def main():
     """Main function to fetch property data results."""
-    print("EagleView Property Data Results Fetcher")
-    print("=" * 50)
+    sys.stdout.write(f"EagleView Property Data Results Fetcher\n{'=' * 50}\n")
     
     # Load configuration
     settings = EagleViewSettings.from_environment()
     if not settings.validate():
-        print("❌ Please set the following environment variables:")
-        print("   EAGLEVIEW_CLIENT_ID")
-        print("   EAGLEVIEW_CLIENT_SECRET")
+        sys.stdout.write(
+            "❌ Please set the following environment variables:\n"
+            "   EAGLEVIEW_CLIENT_ID\n"
+            "   EAGLEVIEW_CLIENT_SECRET\n"
+        )
         return
 
     # Load request files to get request IDs
@@ -157,9 +215,11 @@ def main():
     request_data = load_request_files()
     
     if not request_data:
-        print("No property data requests found in data/requests/")
-        print("You need to submit property data requests first using:")
-        print("  python -m cli.eagleview --operation property-data")
+        sys.stdout.write(
+            "No property data requests found in data/requests/\n"
+            "You need to submit property data requests first using:\n"
+            "  python -m cli.eagleview --operation property-data\n"
+        )
         return
     
     # Extract request IDs
@@ -178,11 +238,16 @@ def main():
     print(f"\n3. Saving property data results...")
     save_property_results(results)
     
-    print(f"\n{'='*50}")
-    print("PROCESS COMPLETED!")
-    print(f"Fetched results for {len([r for r in results.values() if r])} out of {len(request_ids)} requests")
-    print("Results saved to data/results/ directory")
-    print("="*50)
+    # Emit the closing summary in a single write
+    fetched = sum(1 for r in results.values() if r)
+    sys.stdout.write(
+        f"\n{'=' * 50}\n"
+        "PROCESS COMPLETED!\n"
+        f"Fetched results for {fetched} out of {len(request_ids)} requests\n"
+        "Results saved to data/results/ directory\n"
+        f"{'=' * 50}\n"
+    )
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
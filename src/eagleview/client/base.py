@@ -7,18 +7,104 @@ It includes comprehensive error handling, rate limiting, and token management.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import base64
+import csv
 import json
 import time
 import logging
+import math
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator, Tuple
 from ..config.base import EagleViewSettings
-from ..utils.file_ops import setup_logging
+from ..utils.file_ops import dumps_json, loads_json, setup_logging
 from ..utils.cache import cache_result
 
 logger = setup_logging(__name__)
 
+# Connections kept open per host by the shared session
+HTTP_POOL_SIZE = 32
+
+# Default (connect, read) timeout in seconds for every HTTP call
+HTTP_TIMEOUT = (10, 60)
+
+# Size of the chunks downloaded files are streamed to disk in
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# File the access token is persisted to between runs
+TOKEN_FILE = 'eagleview_client_credentials_tokens.json'
+
+# Seconds before expiry at which a token is treated as expired
+TOKEN_EXPIRY_MARGIN = 300
+
+# Access tokens shared by every client in the process, keyed by client ID,
+# as (access token, expiry in epoch seconds)
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+
+# Upper bound in seconds for a single retry backoff
+MAX_BACKOFF_SECONDS = 30
+
+
+def backoff_delay(attempt: int) -> float:
+    """Compute the sleep before retrying after a failed attempt.
+    
+    Exponential backoff with up to a second of random jitter, so workers
+    that failed together don't all retry at the same instant.
+    
+    Args:
+        attempt: Zero-based number of the attempt that failed
+        
+    Returns:
+        Delay in seconds, capped at MAX_BACKOFF_SECONDS
+    """
+    return min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.uniform(0, 1))
+
+
+def retry_delay(response: requests.Response, attempt: int) -> float:
+    """Compute the sleep before retrying after an error response.
+    
+    A 429 carrying a Retry-After value in seconds is honoured (plus a little
+    jitter so concurrent workers don't resume together); anything else falls
+    back to backoff_delay.
+    
+    Args:
+        response: The failed response
+        attempt: Zero-based number of the attempt that failed
+        
+    Returns:
+        Delay in seconds
+    """
+    if response.status_code == 429:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return int(retry_after) + random.uniform(0, 1)
+    return backoff_delay(attempt)
+
+
+def is_result_in_progress(result: Dict) -> bool:
+    """Check whether a property data result is still being processed.
+    
+    Args:
+        result: Property data result or status from get_property_data_result
+        
+    Returns:
+        True if the request is still in progress
+    """
+    status = result.get('status', result.get('request', {}).get('status', ''))
+    return status == 'In Progress' or 'In Progress' in str(result.get('request', {}).get('status', ''))
+
+
+def _is_final_property_result(result: Dict) -> bool:
+    """Only finished property data results are worth caching."""
+    return bool(result) and not is_result_in_progress(result)
+
+
 class EagleViewAPIException(Exception):
     """Custom exception for EagleView API errors.
     
@@ -63,16 +149,49 @@ class EagleViewClient:
         self.is_sandbox = settings.is_sandbox
         
         self.access_token = None
-        self.token_expires_at = None
-        self.last_request_time = 0
-        self.requests_this_minute = 0
-        self.minute_start_time = time.time()
+        self.token_expires_at = None  # Epoch seconds
+        # Serializes token refreshes so concurrent workers share a single one
+        self._token_lock = threading.Lock()
+        
+        # Basic Auth header for token requests, encoded once per client
+        auth_string = f"{settings.client_id}:{settings.client_secret}"
+        self._basic_auth_header = f"Basic {base64.b64encode(auth_string.encode()).decode()}"
+        
+        # Default API request headers, rebuilt only when the access token changes.
+        # Stored as a (token, headers) pair and never mutated once built.
+        self._base_headers = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        }
+        self._request_headers = (None, self._base_headers)
+        
+        # Token bucket for the per-second limit, sliding window for the per-minute limit
+        self.second_capacity = 1.0
+        self.second_tokens = self.second_capacity
+        self.last_refill = time.monotonic()
+        self._per_second = float(settings.requests_per_second)
+        self._min_interval = 1.0 / self._per_second
+        self._minute_window = deque(maxlen=int(settings.requests_per_minute))
+        self._rate_limit_lock = threading.Lock()
+        # Monotonic time until which the server has asked us to hold off
+        self._server_pause_until = 0.0
+        
+        # Shared HTTP session so every service reuses pooled connections
+        self.session = requests.Session()
+        # Retries are handled by make_request so they can re-authenticate on 401
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                              max_retries=0)
+        self.session.mount('https://', adapter)
         
         # Configure client based on environment
         self._configure_for_environment()
         
-        # Load existing token if available
-        self._load_token_from_file()
+        # Reuse a token another client in this process already holds, else load one from file
+        cached_token = _TOKEN_CACHE.get(settings.client_id)
+        if cached_token is not None:
+            self.access_token, self.token_expires_at = cached_token
+        else:
+            self._load_token_from_file()
     
     def _configure_for_environment(self):
         """Configure client behavior based on the environment."""
@@ -150,15 +269,19 @@ class EagleViewClient:
         a JSON file to avoid unnecessary authentication requests.
         """
         try:
-            token_file = 'eagleview_client_credentials_tokens.json'
-            if os.path.exists(token_file):
-                with open(token_file, 'r') as f:
-                    token_data = json.load(f)
+            if os.path.exists(TOKEN_FILE):
+                with open(TOKEN_FILE, 'rb') as f:
+                    token_data = loads_json(f.read())
                     if token_data.get('client_id') == self.settings.client_id:
                         self.access_token = token_data.get('access_token')
+                        expires_epoch = token_data.get('token_expires_epoch')
                         expires_str = token_data.get('token_expires_at')
-                        if expires_str:
-                            self.token_expires_at = datetime.fromisoformat(expires_str)
+                        if expires_epoch is not None:
+                            self.token_expires_at = float(expires_epoch)
+                        elif expires_str:
+                            self.token_expires_at = datetime.fromisoformat(expires_str).timestamp()
+                        if self.access_token and self.token_expires_at is not None:
+                            _TOKEN_CACHE[self.settings.client_id] = (self.access_token, self.token_expires_at)
                         logger.info("Loaded existing token from file")
         except Exception as e:
             logger.warning(f"Could not load token from file: {e}")
@@ -167,16 +290,22 @@ class EagleViewClient:
         """Save token to file for reuse.
         
         This method saves the access token to a JSON file for future reuse.
+        The file is replaced atomically so concurrent readers never see a
+        partially written token.
         
         Args:
             token_data: Token data from the authentication response
         """
         try:
             token_data['saved_at'] = datetime.now().isoformat()
+            token_data['token_expires_epoch'] = self.token_expires_at
+            token_data['token_expires_at'] = datetime.fromtimestamp(self.token_expires_at).isoformat()
             token_data['client_id'] = self.settings.client_id
             token_data['auth_method'] = 'client_credentials'
-            with open('eagleview_client_credentials_tokens.json', 'w') as f:
-                json.dump(token_data, f, indent=2)
+            tmp_file = f"{TOKEN_FILE}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(dumps_json(token_data))
+            os.replace(tmp_file, TOKEN_FILE)
         except Exception as e:
             logger.warning(f"Could not save token to file: {e}")
     
@@ -186,10 +315,25 @@ class EagleViewClient:
         Returns:
             True if token is expired or will expire within 5 minutes, False otherwise
         """
-        if not self.access_token or not self.token_expires_at:
-            return True
+        return self._valid_token() is None
+    
+    def _valid_token(self) -> Optional[str]:
+        """Return the current token unless it is expired or about to expire.
+        
+        The token and its expiry are each read once, so a concurrent
+        _invalidate_token can't clear the token between the check and the
+        return.
+        
+        Returns:
+            Access token string, or None if a new token is needed
+        """
+        token, expires_at = self.access_token, self.token_expires_at
+        if not token or expires_at is None:
+            return None
         # Consider token expired if it expires in the next 5 minutes
-        return datetime.now() >= (self.token_expires_at - timedelta(minutes=5))
+        if time.time() >= expires_at - TOKEN_EXPIRY_MARGIN:
+            return None
+        return token
     
     def get_access_token(self) -> str:
         """Get access token using Client Credentials flow.
@@ -203,51 +347,81 @@ class EagleViewClient:
         Raises:
             EagleViewAPIException: If authentication fails
         """
-        if not self._is_token_expired():
-            return self.access_token
+        token = self._valid_token()
+        if token is not None:
+            return token
+        
+        with self._token_lock:
+            # Another thread may have refreshed the token while this one waited
+            token = self._valid_token()
+            if token is not None:
+                return token
+            return self._request_access_token()
+    
+    def _invalidate_token(self, rejected_token: Optional[str]):
+        """Forget a token the API rejected.
+        
+        Nothing is cleared if another thread has already replaced the token, so
+        a burst of 401s for the same token leads to a single refresh.
+        
+        Args:
+            rejected_token: The access token that was sent with the rejected request
+        """
+        with self._token_lock:
+            if self.access_token == rejected_token:
+                self.access_token = None
+                self.token_expires_at = None
+    
+    def _request_access_token(self) -> str:
+        """Request a new access token (caller holds the token lock).
+        
+        Returns:
+            Access token string
             
+        Raises:
+            EagleViewAPIException: If authentication fails
+        """
         logger.info("Getting new access token...")
         
         # Prepare token request with Basic Auth
         headers = {
             'Content-Type': 'application/x-www-form-urlencoded',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Authorization': self._basic_auth_header
         }
         
-        # Add Basic Auth header
-        import base64
-        auth_string = f"{self.settings.client_id}:{self.settings.client_secret}"
-        encoded_auth = base64.b64encode(auth_string.encode()).decode()
-        headers['Authorization'] = f"Basic {encoded_auth}"
-        
         data = {
             'grant_type': 'client_credentials',
             'scope': 'default'
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.auth_url,
                 headers=headers,
-                data=data
+                data=data,
+                timeout=HTTP_TIMEOUT
             )
             
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = loads_json(response.content)
                 self.access_token = token_data['access_token']
                 expires_in = token_data.get('expires_in', 3600)  # Default to 1 hour
-                self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+                self.token_expires_at = time.time() + expires_in
                 
-                # Save token for reuse
-                self._save_token_to_file(token_data)
+                # Share the token in-process, and only touch the file when the token itself changed
+                previous_token = _TOKEN_CACHE.get(self.settings.client_id)
+                _TOKEN_CACHE[self.settings.client_id] = (self.access_token, self.token_expires_at)
+                if previous_token is None or previous_token[0] != self.access_token:
+                    self._save_token_to_file(token_data)
                 
-                logger.info(f"Successfully obtained access token. Expires at {self.token_expires_at}")
+                logger.info(f"Successfully obtained access token. Expires at {datetime.fromtimestamp(self.token_expires_at)}")
                 return self.access_token
             else:
                 raise EagleViewAPIException(
                     f"Failed to get access token: {response.status_code} - {response.text}",
                     status_code=response.status_code,
-                    response=response.json() if response.content else None
+                    response=self._parse_error_body(response)
                 )
                 
         except requests.RequestException as e:
@@ -259,34 +433,81 @@ class EagleViewClient:
         """Implement rate limiting.
         
         This method enforces rate limits based on the configured requests per
-        second and requests per minute settings.
+        second and requests per minute settings. It is safe to call from
+        multiple threads sharing the same client.
         """
-        current_time = time.time()
-        
-        # Reset minute counter if a minute has passed
-        if current_time - self.minute_start_time >= 60:
-            self.requests_this_minute = 0
-            self.minute_start_time = current_time
-        
-        # Check minute limit
-        if self.requests_this_minute >= self.settings.requests_per_minute:
-            sleep_time = 60 - (current_time - self.minute_start_time)
-            if sleep_time > 0:
-                logger.info(f"Minute rate limit reached. Sleeping for {sleep_time:.1f} seconds")
-                time.sleep(sleep_time)
-                self.requests_this_minute = 0
-                self.minute_start_time = time.time()
-        
-        # Check per-second limit
-        time_since_last_request = current_time - self.last_request_time
-        min_interval = 1.0 / self.settings.requests_per_second
-        if time_since_last_request < min_interval:
-            sleep_time = min_interval - time_since_last_request
+        with self._rate_limit_lock:
+            self._apply_rate_limit()
+    
+    def _apply_rate_limit(self):
+        """Sleep as needed and record the request (caller holds the lock)."""
+        now = time.monotonic()
+        
+        # Quota exhausted according to the server's RateLimit headers
+        if now < self._server_pause_until:
+            sleep_time = self._server_pause_until - now
+            logger.info(f"Server rate limit quota exhausted. Sleeping for {sleep_time:.1f} seconds")
+            time.sleep(sleep_time)
+            now = time.monotonic()
+        
+        # Per-minute limit: once the window is full its oldest request must be 60s old.
+        # The deque's maxlen drops that entry when this request is appended.
+        window = self._minute_window
+        if len(window) == window.maxlen and now - window[0] < 60:
+            sleep_time = 60 - (now - window[0])
+            logger.info(f"Minute rate limit reached. Sleeping for {sleep_time:.1f} seconds")
             time.sleep(sleep_time)
+            now = time.monotonic()
+        
+        # Per-second limit: refill the bucket, waiting only if it holds less than a token
+        tokens = min(self.second_capacity, self.second_tokens + (now - self.last_refill) * self._per_second)
+        if tokens >= 1:
+            self.second_tokens = tokens - 1
+        else:
+            time.sleep((1 - tokens) * self._min_interval)
+            now = time.monotonic()
+            self.second_tokens = 0.0
+        self.last_refill = now
         
-        # Update rate limiting counters
-        self.last_request_time = time.time()
-        self.requests_this_minute += 1
+        window.append(now)
+    
+    def _note_rate_limit_headers(self, response: requests.Response):
+        """Pause upcoming requests when the server reports its quota is used up.
+        
+        Only acts on an explicit RateLimit-Remaining of 0 with a RateLimit-Reset
+        in seconds; responses without these headers leave pacing to the local
+        limits.
+        
+        Args:
+            response: Response whose headers should be inspected
+        """
+        headers = response.headers
+        if headers.get('RateLimit-Remaining') != '0':
+            return
+        reset = headers.get('RateLimit-Reset', '')
+        if reset.isdigit():
+            pause_until = time.monotonic() + min(int(reset), MAX_BACKOFF_SECONDS)
+            if pause_until > self._server_pause_until:
+                self._server_pause_until = pause_until
+    
+    def _parse_error_body(self, response: requests.Response) -> Optional[Any]:
+        """Parse an error response body for EagleViewAPIException.
+        
+        Error pages are not always JSON (for example an HTML 502 from a proxy),
+        so a body that fails to parse is reported as None instead of raising.
+        
+        Args:
+            response: Failed response object
+            
+        Returns:
+            Parsed JSON body, or None if the body is empty or not JSON
+        """
+        if not response.content:
+            return None
+        try:
+            return loads_json(response.content)
+        except ValueError:
+            return None
     
     def make_request(self, method: str, endpoint: str, use_imagery_base: bool = False, 
                     retry_count: int = 3, **kwargs) -> requests.Response:
@@ -300,7 +521,7 @@ class EagleViewClient:
             endpoint: API endpoint path
             use_imagery_base: Whether to use the imagery base URL
             retry_count: Number of retry attempts
-            **kwargs: Additional arguments to pass to requests.request()
+            **kwargs: Additional arguments to pass to Session.request()
             
         Returns:
             Response object from the API request
@@ -308,68 +529,73 @@ class EagleViewClient:
         Raises:
             EagleViewAPIException: If the request fails after all retries
         """
-        # Apply rate limiting
-        self._rate_limit()
-        
         # Get access token
         token = self.get_access_token()
         
-        # Prepare headers
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        }
+        # Prepare headers, reusing the prebuilt set while the token is unchanged
+        headers_token, headers = self._request_headers
+        if headers_token != token:
+            headers = {'Authorization': f'Bearer {token}', **self._base_headers}
+            self._request_headers = (token, headers)
         
         # Merge headers
         if 'headers' in kwargs:
-            headers.update(kwargs['headers'])
+            headers = {**headers, **kwargs['headers']}
         kwargs['headers'] = headers
+        kwargs.setdefault('timeout', HTTP_TIMEOUT)
         
         # Make request
         base_url = self.imagery_base_url if use_imagery_base else self.base_url
         url = f"{base_url}{endpoint}"
         logger.debug(f"Making {method} request to {url}")
         
-        for attempt in range(retry_count):
+        attempt = 0
+        token_refreshed = False
+        while attempt < retry_count:
+            # Every request sent, including retries, counts against the rate limit
+            self._rate_limit()
             try:
-                response = requests.request(method, url, **kwargs)
-                
-                # Handle common error responses
-                if response.status_code == 401:
-                    # Token might be expired, clear it and try once more
-                    self.access_token = None
-                    self.token_expires_at = None
-                    token = self.get_access_token()
-                    kwargs['headers']['Authorization'] = f'Bearer {token}'
-                    response = requests.request(method, url, **kwargs)
-                
-                # If we get a successful response, return it
-                if response.ok:
-                    return response
-                
-                # If we get a 404, it might be that the endpoint doesn't exist
-                if response.status_code == 404:
-                    logger.warning(f"Endpoint {url} not found (404)")
-                    return response
-                    
-                # For other errors, log and potentially retry
-                logger.warning(f"Attempt {attempt + 1}/{retry_count} failed with status {response.status_code}")
-                if attempt < retry_count - 1:  # Don't sleep on the last attempt
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    
+                response = self.session.request(method, url, **kwargs)
             except requests.RequestException as e:
                 logger.warning(f"Attempt {attempt + 1}/{retry_count} failed with network error: {e}")
-                if attempt < retry_count - 1:  # Don't sleep on the last attempt
-                    time.sleep(2 ** attempt)  # Exponential backoff
                 if attempt == retry_count - 1:  # Last attempt
                     raise EagleViewAPIException(f"Network error after {retry_count} attempts: {e}")
+                time.sleep(backoff_delay(attempt))
+                attempt += 1
+                continue
+            self._note_rate_limit_headers(response)
+            
+            # Token might be expired, refresh it once and resend without using up an attempt
+            if response.status_code == 401 and not token_refreshed:
+                token_refreshed = True
+                response.close()
+                self._invalidate_token(token)
+                token = self.get_access_token()
+                kwargs['headers'] = {**kwargs['headers'], 'Authorization': f'Bearer {token}'}
+                continue
+            
+            # If we get a successful response, return it
+            if response.ok:
+                return response
+            
+            # If we get a 404, it might be that the endpoint doesn't exist
+            if response.status_code == 404:
+                logger.warning(f"Endpoint {response.url} not found (404)")
+                return response
+                
+            # For other errors, log and potentially retry
+            logger.warning(f"Attempt {attempt + 1}/{retry_count} failed with status {response.status_code}")
+            if attempt < retry_count - 1:  # Don't sleep on the last attempt
+                # Release the connection of a streamed response before resending
+                response.close()
+                time.sleep(retry_delay(response, attempt))
+            attempt += 1
         
         # If we get here, all retries failed
         raise EagleViewAPIException(
             f"API request failed after {retry_count} attempts: {response.status_code} - {response.text}",
             status_code=response.status_code,
-            response=response.json() if response.content else None
+            response=self._parse_error_body(response)
         )
 
     # Business logic methods
@@ -385,7 +611,7 @@ class EagleViewClient:
             endpoint = '/GetAvailableProducts'
             response = self.make_request('GET', endpoint)
             if response.status_code == 200:
-                return response.json()
+                return loads_json(response.content)
             else:
                 logger.warning(f"Products endpoint {endpoint} returned status {response.status_code}")
                 logger.warning(f"Response: {response.text}")
@@ -398,6 +624,10 @@ class EagleViewClient:
     def get_all_customer_reports(self, save_to_csv: bool = True) -> List[Dict]:
         """Get all reports for the customer.
         
+        The first page is fetched on its own to learn the total number of
+        reports; the remaining pages are then fetched concurrently, bounded by
+        the configured requests-per-second limit.
+        
         Args:
             save_to_csv: Whether to save reports to a CSV file
             
@@ -405,75 +635,144 @@ class EagleViewClient:
             List of customer report dictionaries
         """
         try:
-            # Based on the API documentation, the correct endpoint is /v3/Report/GetReports
-            # This requires a POST request with pagination parameters
-            endpoint = '/v3/Report/GetReports'
-            
-            # First, we need to get reports with pagination
-            page = 1
-            count = 100  # Number of reports per page
             all_reports = []
-            
-            while True:
-                # Prepare the request body for pagination
-                body = {
-                    "productsToFiterBy": [],  # Empty array to get all products
-                    "statusesToFilterBy": "",
-                    "sortBy": "",
-                    "sortAscending": True,
-                    "subStatusToFilterBy": "",
-                    "fieldsToFilterBy": [],
-                    "textToFilterBy": "",
-                    "referenceId": "",
-                    "emailCC": "",
-                    "fromDate": "",
-                    "toDate": ""
-                }
-                
-                response = self.make_request('POST', f"{endpoint}?page={page}&count={count}", json=body)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if isinstance(data, list) and len(data) > 0:
-                        # Extract reports from the response
-                        reports_data = data[0] if len(data) > 0 else {}
-                        report_list = reports_data.get('ReportList', [])
-                        total_reports = reports_data.get('TotalOfReports', 0)
-                        
-                        if report_list:
-                            # If report_list is a list of reports, extend all_reports
-                            if isinstance(report_list, list):
-                                all_reports.extend(report_list)
-                            # If report_list is a single report object, append it
-                            else:
-                                all_reports.append(report_list)
-                        
-                        # Check if we've got all reports
-                        if len(all_reports) >= total_reports or len(report_list) < count:
-                            break
-                        else:
-                            page += 1
-                    else:
-                        break
-                else:
-                    logger.warning(f"Reports endpoint {endpoint} returned status {response.status_code}")
-                    logger.warning(f"Response: {response.text}")
-                    break
+            # CSV columns, collected as pages arrive so the reports aren't walked twice
+            fieldnames = set()
+            for report_list in self.iter_customer_report_pages():
+                all_reports.extend(report_list)
+                for report in report_list:
+                    fieldnames.update(report)
             
             if save_to_csv:
-                self._save_reports_to_csv(all_reports)
+                self._save_reports_to_csv(all_reports, fieldnames=sorted(fieldnames))
             
             return all_reports
         except Exception as e:
             logger.error(f"Error getting customer reports: {e}")
             return []
+    
+    def iter_customer_report_pages(self) -> Iterator[List[Dict]]:
+        """Yield the customer's reports one page at a time, in page order.
+        
+        Callers can start working on a page while later pages are still being
+        fetched, and never need to hold every report at once. Pages after the
+        first are fetched concurrently; closing the iterator early cancels the
+        pages that haven't been requested yet.
+        
+        Yields:
+            Lists of customer report dictionaries
+            
+        Raises:
+            EagleViewAPIException: If a page request fails after all retries
+        """
+        # Based on the API documentation, the correct endpoint is /v3/Report/GetReports
+        # This requires a POST request with pagination parameters
+        endpoint = '/v3/Report/GetReports'
+        count = 100  # Number of reports per page
+        
+        # The request body is the same for every page
+        body = {
+            "productsToFiterBy": [],  # Empty array to get all products
+            "statusesToFilterBy": "",
+            "sortBy": "",
+            "sortAscending": True,
+            "subStatusToFilterBy": "",
+            "fieldsToFilterBy": [],
+            "textToFilterBy": "",
+            "referenceId": "",
+            "emailCC": "",
+            "fromDate": "",
+            "toDate": ""
+        }
+        
+        first_page = self._fetch_reports_page(endpoint, 1, count, body)
+        if first_page is None:
+            return
+        report_list, total_reports = first_page
+        yield report_list
+        
+        # Fetch the remaining pages concurrently if there are any
+        if len(report_list) >= count and len(report_list) < total_reports:
+            num_pages = math.ceil(total_reports / count)
+            pages = self._map_concurrent(
+                lambda page: self._fetch_reports_page(endpoint, page, count, body),
+                range(2, num_pages + 1)
+            )
+            with closing(pages):
+                # Results arrive in page order; stop at the first missing page
+                for page_result in pages:
+                    if page_result is None:
+                        break
+                    report_list, _ = page_result
+                    yield report_list
+                    if len(report_list) < count:
+                        break
+    
+    def _fetch_reports_page(self, endpoint: str, page: int, count: int,
+                            body: Dict) -> Optional[Tuple[List[Dict], int]]:
+        """Fetch a single page of customer reports.
+        
+        Args:
+            endpoint: Reports endpoint path
+            page: Page number to fetch (1-based)
+            count: Number of reports per page
+            body: Request body with the report filters
+            
+        Returns:
+            Tuple of (reports on the page, total number of reports), or None if
+            the page could not be fetched or was empty
+        """
+        response = self.make_request('POST', endpoint, params={'page': page, 'count': count}, json=body)
+        
+        if response.status_code != 200:
+            logger.warning(f"Reports endpoint {endpoint} returned status {response.status_code}")
+            logger.warning(f"Response: {response.text}")
+            return None
+        
+        data = loads_json(response.content)
+        if not isinstance(data, list) or not data:
+            return None
+        
+        # Extract reports from the response, wrapping a single report object in a list
+        page_data = data[0]
+        report_list = page_data.get('ReportList') or []
+        if not isinstance(report_list, list):
+            report_list = [report_list]
+        return report_list, page_data.get('TotalOfReports', 0)
 
-    def _save_reports_to_csv(self, reports: List[Dict], filename: Optional[str] = None):
+    def _map_concurrent(self, fn: Callable[[Any], Any], items: Iterable[Any],
+                        concurrency: Optional[int] = None) -> Iterator[Any]:
+        """Apply fn to each item on a bounded thread pool.
+        
+        Requests made by fn still go through the shared rate limiter, so the
+        pool only overlaps the time spent waiting on responses.
+        
+        Args:
+            fn: Function to call with each item
+            items: Items to process
+            concurrency: Maximum number of worker threads (defaults to the
+                configured requests per second)
+            
+        Returns:
+            Iterator over the results, in the same order as items
+        """
+        items = list(items)
+        if not items:
+            return
+        if concurrency is None:
+            concurrency = int(self.settings.requests_per_second)
+        max_workers = max(1, min(concurrency, HTTP_POOL_SIZE, len(items)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(fn, items)
+
+    def _save_reports_to_csv(self, reports: List[Dict], filename: Optional[str] = None,
+                             fieldnames: Optional[List[str]] = None):
         """Save reports to CSV file.
         
         Args:
             reports: List of report dictionaries to save
             filename: Filename for the CSV file (defaults to timestamped name)
+            fieldnames: CSV columns (defaults to the sorted union of all report keys)
         """
         if not reports:
             return
@@ -482,19 +781,17 @@ class EagleViewClient:
             filename = f"eagleview_reports_client_credentials_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         
         try:
-            import csv
-            
-            # Get all possible field names
-            fieldnames = set()
-            for report in reports:
-                fieldnames.update(report.keys())
-            fieldnames = sorted(list(fieldnames))
+            # Get all possible field names unless the caller already collected them
+            if fieldnames is None:
+                fieldnames = set()
+                for report in reports:
+                    fieldnames.update(report.keys())
+                fieldnames = sorted(fieldnames)
             
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
                 writer.writeheader()
-                for report in reports:
-                    writer.writerow(report)
+                writer.writerows(reports)
             
             logger.info(f"Reports saved to CSV: {filename}")
         except Exception as e:
@@ -510,10 +807,10 @@ class EagleViewClient:
             Report detail dictionary
         """
         try:
-            endpoint = f'/v3/Report/GetReport?reportId={report_id}'
-            response = self.make_request('GET', endpoint)
+            endpoint = '/v3/Report/GetReport'
+            response = self.make_request('GET', endpoint, params={'reportId': report_id})
             if response.status_code == 200:
-                data = response.json()
+                data = loads_json(response.content)
                 # Return the first item if it's a list
                 if isinstance(data, list) and len(data) > 0:
                     return data[0]
@@ -526,6 +823,62 @@ class EagleViewClient:
             logger.error(f"Error getting report detail for report {report_id}: {e}")
             return {}
 
+    def get_report_file_links(self, report_id: int) -> Dict:
+        """Get file download links for a specific report.
+        
+        Args:
+            report_id: ID of the report to get file links for
+            
+        Returns:
+            Dictionary containing file download links
+        """
+        try:
+            endpoint = f'/v3/Report/{report_id}/file-links'
+            response = self.make_request('GET', endpoint)
+            if response.status_code == 200:
+                return loads_json(response.content)
+            else:
+                logger.warning(f"Failed to get file links for report {report_id}: {response.status_code}")
+                logger.warning(f"Response: {response.text}")
+                return {}
+        except Exception as e:
+            logger.error(f"Error getting file links for report {report_id}: {e}")
+            return {}
+
+    def open_report_file(self, report_id: int, file_type: Optional[int] = None,
+                         file_format: Optional[int] = None) -> requests.Response:
+        """Request a report file without reading its body.
+        
+        The response is streamed, so the caller must close it (for example by
+        using it as a context manager) after consuming the body.
+        
+        Args:
+            report_id: Report ID to download the file for
+            file_type: File type to download (optional)
+            file_format: File format to download (optional)
+            
+        Returns:
+            Streamed response object from the API request
+        """
+        # requests leaves out parameters whose value is None
+        params = {'reportId': report_id, 'fileType': file_type, 'fileFormat': file_format}
+        return self.make_request('GET', '/v1/File/GetReportFile', params=params, stream=True)
+
+    def open_image(self, image_token: str) -> requests.Response:
+        """Request a property image without reading its body.
+        
+        The response is streamed, so the caller must close it (for example by
+        using it as a context manager) after consuming the body.
+        
+        Args:
+            image_token: Image token from a property data result
+            
+        Returns:
+            Streamed response object from the API request
+        """
+        return self.make_request('GET', f'/property/v2/image/{image_token}', use_imagery_base=True,
+                                 headers={'Accept': 'image/png'}, stream=True)
+
     def get_imagery_for_location(self, location_data: Dict) -> Dict:
         """Get imagery for a specific location using the Imagery API.
         
@@ -539,7 +892,7 @@ class EagleViewClient:
             endpoint = '/imagery/v3/discovery/rank/location'
             response = self.make_request('POST', endpoint, use_imagery_base=True, json=location_data)
             if response.status_code == 200:
-                return response.json()
+                return loads_json(response.content)
             else:
                 logger.warning(f"Imagery endpoint {endpoint} returned status {response.status_code}")
                 logger.warning(f"Response: {response.text}")
@@ -572,7 +925,7 @@ class EagleViewClient:
             }
             response = self.make_request('POST', endpoint, use_imagery_base=True, json=request_data)
             if response.status_code == 202:
-                return response.json()
+                return loads_json(response.content)
             else:
                 logger.warning(f"Property data endpoint {endpoint} returned status {response.status_code}")
                 logger.warning(f"Response: {response.text}")
@@ -599,7 +952,7 @@ class EagleViewClient:
             }
             response = self.make_request('POST', endpoint, use_imagery_base=True, json=request_data)
             if response.status_code == 202:
-                return response.json()
+                return loads_json(response.content)
             else:
                 logger.warning(f"Property data endpoint {endpoint} returned status {response.status_code}")
                 logger.warning(f"Response: {response.text}")
@@ -608,7 +961,8 @@ class EagleViewClient:
             logger.error(f"Error requesting property data: {e}")
             return {}
 
-    @cache_result(ttl_seconds=600)  # Cache for 10 minutes
+    # Cache finished results for 10 minutes; in-progress ones must be polled again
+    @cache_result(ttl_seconds=600, cache_if=_is_final_property_result)
     def get_property_data_result(self, request_id: str) -> Dict:
         """Get the result of a property data request.
         
@@ -622,10 +976,10 @@ class EagleViewClient:
             endpoint = f'/property/v2/result/{request_id}'
             response = self.make_request('GET', endpoint, use_imagery_base=True)
             if response.status_code == 200:
-                return response.json()
+                return loads_json(response.content)
             elif response.status_code == 202:
                 # Still processing
-                return response.json()
+                return loads_json(response.content)
             else:
                 logger.warning(f"Property data result endpoint {endpoint} returned status {response.status_code}")
                 logger.warning(f"Response: {response.text}")
@@ -7,9 +7,29 @@ loading settings from environment variables or YAML configuration files.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 import os
 
+@lru_cache(maxsize=100)
+def _load_yaml_file(filepath: str, mtime: float, size: int) -> dict:
+    """Parse a YAML file, caching the result per file version.
+    
+    The modification time and size are part of the cache key so that an
+    edited file is parsed again instead of returning stale settings.
+    
+    Args:
+        filepath: Path to the YAML file
+        mtime: Modification time of the file
+        size: Size of the file in bytes
+        
+    Returns:
+        Parsed YAML data
+    """
+    import yaml
+    with open(filepath, 'r') as f:
+        return yaml.safe_load(f)
+
 @dataclass
 class EagleViewSettings:
     """Configuration settings for EagleView API client.
@@ -106,9 +126,8 @@ class EagleViewSettings:
             ValueError: If there's an error loading or parsing the YAML file
         """
         try:
-            import yaml
-            with open(filepath, 'r') as f:
-                config_data = yaml.safe_load(f)
+            stat = os.stat(filepath)
+            config_data = _load_yaml_file(os.path.abspath(filepath), stat.st_mtime, stat.st_size)
             
             # Extract eagleview settings
             eagleview_config = config_data.get('eagleview', {})
@@ -158,6 +177,15 @@ class EagleViewSettings:
         """
         return bool(self.client_id and self.client_secret)
     
+    @property
+    def is_valid(self) -> bool:
+        """Whether the required configuration is present.
+        
+        Computed on access rather than cached, since the settings are a
+        mutable dataclass and credentials may be filled in after creation.
+        """
+        return self.validate()
+    
     def get_api_urls(self) -> dict:
         """Get API URLs based on environment setting.
         
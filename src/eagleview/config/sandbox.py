@@ -6,6 +6,14 @@ Contains sandbox-specific settings and constraints.
 from .base import EagleViewSettings
 from typing import Optional
 
+# Default coordinates within the sandbox area
+# Bounding box: -96.00532698173473, 41.24140396772262, -95.97589954958912, 41.25672882015283
+SANDBOX_COORDINATES = (
+    {"lat": 41.25, "lon": -95.99},
+    {"lat": 41.245, "lon": -95.98},
+    {"lat": 41.255, "lon": -96.0}
+)
+
 class SandboxConfig(EagleViewSettings):
     """Configuration settings for EagleView API sandbox environment.
     
@@ -4,15 +4,27 @@ Handles downloading and saving property images.
 """
 
 import logging
-import requests
 import os
-import time
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
-from ...client.base import EagleViewClient
-from ...utils.file_ops import ensure_directory_exists, get_data_directory, setup_logging
+from ...client.base import DOWNLOAD_CHUNK_SIZE, EagleViewClient
+from ...utils.file_ops import (ensure_directory_exists, extension_for_content_type, get_data_directory,
+                               setup_logging)
 
 logger = setup_logging(__name__)
 
+# Extensions a downloaded image can be saved with
+IMAGE_EXTENSIONS = ('.jpg', '.png')
+
+# File extension for each image media type; anything else is saved as PNG
+IMAGE_EXTENSION_BY_TYPE = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+}
+
+
 class ImageDownloadService:
     """Service for handling image download operations.
     
@@ -29,15 +41,21 @@ class ImageDownloadService:
         """
         self.client = client
     
-    def download_property_images(self, property_data: Dict, image_category: str = "property_images") -> int:
+    def download_property_images(self, property_data: Dict, image_category: str = "property_images",
+                                 max_workers: int = 1) -> int:
         """Download property images using image tokens from property data results.
         
-        This method downloads property images with retry logic and exponential backoff.
-        Images are saved in the data/imagery/{image_category} directory.
+        This method downloads property images through the client, which retries
+        failed requests with exponential backoff.
+        Images are saved in the data/imagery/{image_category} directory. When
+        max_workers is greater than one, images are downloaded concurrently over
+        the client's shared session so connections are reused between downloads.
+        Every download attempt goes through the client's rate limiter.
         
         Args:
             property_data: Property data response containing image references and tokens
             image_category: Category name for organizing downloaded images
+            max_workers: Maximum number of images to download concurrently
             
         Returns:
             Number of successfully downloaded images
@@ -52,80 +70,101 @@ class ImageDownloadService:
         
         logger.info(f"Found {len(image_references)} image references")
         
-        # Get the base URL for image downloads from client settings
-        urls = self.client.settings.get_api_urls()
-        image_base_url = urls['imagery_base_url']
-        
-        # Download each image
-        downloaded_count = 0
+        # Collect the images that can be downloaded
+        jobs = []
         for i, image_ref in enumerate(image_references):
             if image_ref in imagery_data:
                 image_info = imagery_data[image_ref]
-                image_token = image_info.get('image_token')
-                
-                if image_token:
-                    logger.info(f"Downloading image {i+1}/{len(image_references)}: {image_ref}")
-                    logger.info(f"  Token: {image_token}")
-                    logger.info(f"  View: {image_info.get('metadata', {}).get('view', 'unknown')}")
-                    logger.info(f"  Shot date: {image_info.get('metadata', {}).get('shot_date', 'unknown')}")
-                    
-                    retry_count = 3
-                    for attempt in range(retry_count):
-                        try:
-                            # Get access token
-                            token = self.client.get_access_token()
-                            
-                            # Prepare headers
-                            headers = {
-                                'Authorization': f'Bearer {token}',
-                                'Accept': 'image/png'
-                            }
-                            
-                            # Make request to download image using configurable URL
-                            url = f"{image_base_url}/property/v2/image/{image_token}"
-                            response = requests.get(url, headers=headers)
-                            
-                            if response.status_code == 200:
-                                # Determine file extension based on content type
-                                content_type = response.headers.get('Content-Type', 'image/png')
-                                if 'jpeg' in content_type:
-                                    extension = '.jpg'
-                                elif 'png' in content_type:
-                                    extension = '.png'
-                                else:
-                                    extension = '.png'
-                                
-                                # Create filename
-                                filename = f"{images_dir}/{image_ref}_{image_token[:8]}{extension}"
-                                
-                                # Save image
-                                with open(filename, 'wb') as f:
-                                    f.write(response.content)
-                                
-                                logger.info(f"  [SUCCESS] Image saved to: {filename}")
-                                downloaded_count += 1
-                                break  # Success, break out of retry loop
-                            else:
-                                logger.error(f"  [ERROR] Failed to download image: {response.status_code}")
-                                logger.error(f"  Response: {response.text[:100]}...")
-                                if attempt < retry_count - 1:
-                                    logger.info(f"  Retrying... (attempt {attempt + 2}/{retry_count})")
-                                    time.sleep(2 ** attempt)  # Exponential backoff
-                        except Exception as e:
-                            logger.error(f"  [ERROR] Exception during download: {e}")
-                            if attempt < retry_count - 1:
-                                logger.info(f"  Retrying... (attempt {attempt + 2}/{retry_count})")
-                                time.sleep(2 ** attempt)  # Exponential backoff
-                            else:
-                                logger.error(f"  Failed to download image after {retry_count} attempts")
+                if image_info.get('image_token'):
+                    jobs.append((i, image_ref, image_info))
                 else:
                     logger.warning(f"  [WARNING] No image token found for {image_ref}")
             else:
                 logger.warning(f"  [WARNING] No imagery data found for {image_ref}")
         
+        # Download each image
+        max_workers = max(1, min(max_workers, len(jobs) or 1))
+        
+        def download(job):
+            i, image_ref, image_info = job
+            return self._download_image(images_dir, image_ref, image_info, i, len(image_references))
+        
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(download, jobs))
+        else:
+            results = [download(job) for job in jobs]
+        
+        downloaded_count = sum(results)
+        
         logger.info(f"Download Summary:")
         logger.info(f"  Total images referenced: {len(image_references)}")
         logger.info(f"  Successfully downloaded: {downloaded_count}")
         logger.info(f"  Images saved to: {images_dir}")
         
-        return downloaded_count
\ No newline at end of file
+        return downloaded_count
+    
+    def _download_image(self, images_dir: str, image_ref: str, image_info: Dict, index: int,
+                        total: int) -> bool:
+        """Download a single property image.
+        
+        Authentication, rate limiting and retries are handled by the client.
+        
+        Args:
+            images_dir: Directory to save the image in
+            image_ref: Image reference name from the property data
+            image_info: Imagery entry for the reference, including the image token
+            index: Position of the image in the reference list
+            total: Total number of image references (for logging)
+            
+        Returns:
+            True if the image was downloaded and saved, False otherwise
+        """
+        image_token = image_info.get('image_token')
+        logger.info(f"Downloading image {index+1}/{total}: {image_ref}")
+        logger.info(f"  Token: {image_token}")
+        logger.info(f"  View: {image_info.get('metadata', {}).get('view', 'unknown')}")
+        logger.info(f"  Shot date: {image_info.get('metadata', {}).get('shot_date', 'unknown')}")
+        
+        # Skip images already downloaded by an earlier run (one stat per candidate)
+        file_prefix = os.path.join(images_dir, f"{image_ref}_{image_token[:8]}")
+        for extension in IMAGE_EXTENSIONS:
+            existing = file_prefix + extension
+            try:
+                st = os.stat(existing)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+                logger.info(f"  [SKIPPED] Image already downloaded: {existing}")
+                return True
+        
+        try:
+            with self.client.open_image(image_token) as response:
+                if response.status_code != 200:
+                    logger.error(f"  [ERROR] Failed to download image: {response.status_code}")
+                    # Read only the start of the body rather than the whole stream
+                    preview = next(response.iter_content(chunk_size=100), b'')
+                    logger.error(f"  Response: {preview.decode('utf-8', errors='replace')}...")
+                    return False
+                
+                # Determine file extension based on content type
+                extension = extension_for_content_type(response.headers.get('Content-Type'),
+                                                       IMAGE_EXTENSION_BY_TYPE, '.png')
+                
+                # Create filename
+                filename = file_prefix + extension
+                
+                # Stream the image to disk instead of holding it in memory. It is
+                # written under a temporary name so an interrupted download is
+                # never mistaken for a finished one on the next run.
+                tmp_filename = f"{filename}.part"
+                with open(tmp_filename, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(tmp_filename, filename)
+            
+            logger.info(f"  [SUCCESS] Image saved to: {filename}")
+            return True
+        except Exception as e:
+            logger.error(f"  [ERROR] Exception during download: {e}")
+            return False
@@ -4,14 +4,27 @@ Handles imagery requests and processing.
 """
 
 import logging
-import json
+import threading
 import time
-from typing import List, Dict, Optional
-from ...client.base import EagleViewClient
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
+from ...client.base import EagleViewClient, backoff_delay
+from ...config.sandbox import SANDBOX_COORDINATES
 from ...utils.file_ops import save_json_data, generate_timestamped_filename, get_data_directory, setup_logging
 
 logger = setup_logging(__name__)
 
+# GeoJSON point feature sent as the imagery search center, filled with (lon, lat).
+# %r keeps the same float text json.dumps would produce.
+GEOJSON_POINT_TEMPLATE = '{"type": "Feature", "geometry": {"type": "Point", "coordinates": [%r, %r]}, "properties": null}'
+
+# Search radius around the requested point
+IMAGERY_SEARCH_RADIUS_METERS = 50
+
+# Successful imagery responses kept in memory, keyed by rounded (lat, lon, radius)
+IMAGERY_CACHE_SIZE = 1024
+IMAGERY_CACHE_TTL_SECONDS = 300
+
 class ImageryService:
     """Service for handling imagery operations.
     
@@ -26,6 +39,31 @@ class ImageryService:
             client: An authenticated EagleViewClient instance
         """
         self.client = client
+        
+        # LRU of (lat, lon, radius) -> (response, monotonic time stored)
+        self._imagery_cache: "OrderedDict[Tuple[float, float, int], Tuple[Dict, float]]" = OrderedDict()
+        self._imagery_cache_lock = threading.Lock()
+    
+    def _get_cached_imagery(self, key: Tuple[float, float, int]) -> Optional[Dict]:
+        """Return a fresh cached imagery response for the key, if there is one."""
+        with self._imagery_cache_lock:
+            entry = self._imagery_cache.get(key)
+            if entry is None:
+                return None
+            response, stored_at = entry
+            if time.monotonic() - stored_at >= IMAGERY_CACHE_TTL_SECONDS:
+                del self._imagery_cache[key]
+                return None
+            self._imagery_cache.move_to_end(key)
+            return response
+    
+    def _cache_imagery(self, key: Tuple[float, float, int], response: Dict):
+        """Store an imagery response, evicting the least recently used entry when full."""
+        with self._imagery_cache_lock:
+            self._imagery_cache[key] = (response, time.monotonic())
+            self._imagery_cache.move_to_end(key)
+            if len(self._imagery_cache) > IMAGERY_CACHE_SIZE:
+                self._imagery_cache.popitem(last=False)
     
     def request_imagery_for_location(self, name: str, lat: float, lon: float) -> Optional[Dict]:
         """Request imagery for a specific location.
@@ -61,24 +99,24 @@ class ImageryService:
             if not (bounds['min_lon'] <= lon <= bounds['max_lon']):
                 raise ValueError(f"Longitude {lon} is outside sandbox bounds")
         
+        # Identical locations are served from memory for a few minutes
+        cache_key = (round(lat, 6), round(lon, 6), IMAGERY_SEARCH_RADIUS_METERS)
+        cached = self._get_cached_imagery(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached imagery for {name} ({lat}, {lon})")
+            return cached
+        
         logger.info(f"Requesting imagery for {name} ({lat}, {lon})")
         
         imagery_request = {
             "center": {
                 "point": {
                     "geojson": {
-                        "value": json.dumps({
-                            "type": "Feature",
-                            "geometry": {
-                                "type": "Point",
-                                "coordinates": [lon, lat]
-                            },
-                            "properties": None
-                        }),
+                        "value": GEOJSON_POINT_TEMPLATE % (lon, lat),
                         "epsg": "EPSG:4326"
                     }
                 },
-                "radius_in_meters": 50
+                "radius_in_meters": IMAGERY_SEARCH_RADIUS_METERS
             }
         }
         
@@ -88,18 +126,17 @@ class ImageryService:
                 imagery_response = self.client.get_imagery_for_location(imagery_request)
                 if imagery_response:
                     logger.info(f"  [SUCCESS] Imagery request completed for {name}")
+                    self._cache_imagery(cache_key, imagery_response)
                     return imagery_response
                 else:
+                    # An empty response means there is no imagery here; asking again won't change that
                     logger.warning(f"  [WARNING] No imagery data returned for {name}")
-                    if attempt < retry_count - 1:
-                        logger.info(f"  Retrying... (attempt {attempt + 2}/{retry_count})")
-                        time.sleep(2 ** attempt)  # Exponential backoff
                     return None
             except Exception as e:
                 logger.error(f"  [ERROR] Exception during imagery request for {name}: {e}")
                 if attempt < retry_count - 1:
                     logger.info(f"  Retrying... (attempt {attempt + 2}/{retry_count})")
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    time.sleep(backoff_delay(attempt))
                 else:
                     logger.error(f"  Failed to get imagery after {retry_count} attempts")
                     return None
@@ -110,12 +147,8 @@ class ImageryService:
         Returns:
             A list of coordinate dictionaries with 'lat' and 'lon' keys
         """
-        # Bounding box: -96.00532698173473, 41.24140396772262, -95.97589954958912, 41.25672882015283
-        return [
-            {"lat": 41.25, "lon": -95.99},
-            {"lat": 41.245, "lon": -95.98},
-            {"lat": 41.255, "lon": -96.0}
-        ]
+        # Copy so callers can modify the result without touching the shared defaults
+        return [dict(coord) for coord in SANDBOX_COORDINATES]
     
     def save_imagery_data(self, imagery_data: Dict, name: str, lat: float, lon: float, 
                          output_dir: str = None) -> bool:
@@ -5,9 +5,11 @@ Handles property data requests and results processing with multi-environment sup
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from ...client.base import EagleViewClient
+from ...client.base import EagleViewClient, backoff_delay
 from ...config.base import EagleViewSettings
+from ...config.sandbox import SANDBOX_COORDINATES
 from ...utils.file_ops import save_json_data, generate_timestamped_filename, get_data_directory, setup_logging
 from ...utils.cache import cache_result
 
@@ -52,58 +54,116 @@ class PropertyDataService:
         Raises:
             ValueError: If coordinates are not in the correct format or out of bounds
         """
-        # Validate coordinates
+        self._validate_coordinates_list(coordinates)
+        
+        logger.info(f"Submitting property data requests for {len(coordinates)} coordinates")
+        requests_data = []
+        
+        for i, coord in enumerate(coordinates):
+            response = self._submit_coordinate_request(i, coord, len(coordinates))
+            if response:
+                requests_data.append(response)
+        
+        return requests_data
+    
+    def submit_coordinates_requests_batched(self, coordinates: List[Dict[str, float]],
+                                            concurrency: int = 8) -> List[Dict]:
+        """Submit property data requests for a list of coordinates concurrently.
+        
+        The API accepts one coordinate per request, so the requests are issued
+        from a thread pool to overlap their network latency. The client's rate
+        limiter is shared by all workers. Responses are returned in the same
+        order as the input coordinates.
+        
+        Args:
+            coordinates: A list of dictionaries containing 'lat' and 'lon' keys
+            concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            A list of response dictionaries from the property data requests
+            
+        Raises:
+            ValueError: If coordinates are not in the correct format or out of bounds
+        """
+        self._validate_coordinates_list(coordinates)
+        
+        if concurrency <= 1 or len(coordinates) <= 1:
+            return self.submit_coordinates_requests(coordinates)
+        
+        logger.info(f"Submitting property data requests for {len(coordinates)} coordinates "
+                    f"(concurrency: {concurrency})")
+        
+        total = len(coordinates)
+        with ThreadPoolExecutor(max_workers=min(concurrency, total)) as executor:
+            responses = executor.map(
+                lambda item: self._submit_coordinate_request(item[0], item[1], total),
+                enumerate(coordinates)
+            )
+            return [response for response in responses if response]
+    
+    def _validate_coordinates_list(self, coordinates: List[Dict[str, float]]):
+        """Validate the format and bounds of a list of coordinates.
+        
+        Args:
+            coordinates: A list of dictionaries containing 'lat' and 'lon' keys
+            
+        Raises:
+            ValueError: If coordinates are not in the correct format or out of bounds
+        """
         if not isinstance(coordinates, list):
             raise ValueError("Coordinates must be a list of dictionaries")
         
+        # Resolve the environment's validator once rather than per coordinate
+        validate = self.client.coordinate_validator if self.client.settings.validate_coordinates else None
+        bounds_error = "is outside sandbox bounds" if self.is_sandbox else "is invalid"
+        
         for i, coord in enumerate(coordinates):
             if not isinstance(coord, dict):
                 raise ValueError(f"Coordinate {i} must be a dictionary")
             if 'lat' not in coord or 'lon' not in coord:
                 raise ValueError(f"Coordinate {i} must contain 'lat' and 'lon' keys")
-            if not isinstance(coord['lat'], (int, float)) or not isinstance(coord['lon'], (int, float)):
+            lat, lon = coord['lat'], coord['lon']
+            if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
                 raise ValueError(f"Coordinate {i} 'lat' and 'lon' must be numeric")
             
             # Validate coordinates based on environment settings
-            if self.client.settings.validate_coordinates:
-                if self.client.validate_coordinates(coord['lat'], coord['lon']):
-                    # Coordinate is valid
-                    pass
-                else:
-                    if self.is_sandbox:
-                        raise ValueError(f"Coordinate {i} ({coord['lat']}, {coord['lon']}) is outside sandbox bounds")
-                    else:
-                        raise ValueError(f"Coordinate {i} ({coord['lat']}, {coord['lon']}) is invalid")
-        
-        logger.info(f"Submitting property data requests for {len(coordinates)} coordinates")
-        requests_data = []
+            if validate is not None and not validate(lat, lon):
+                raise ValueError(f"Coordinate {i} ({lat}, {lon}) {bounds_error}")
+    
+    def _submit_coordinate_request(self, index: int, coord: Dict[str, float], total: int) -> Optional[Dict]:
+        """Submit a single property data request with retry logic.
         
-        for i, coord in enumerate(coordinates):
-            logger.info(f"Submitting request {i+1}/{len(coordinates)} for coordinates {coord}")
-            retry_count = 3
-            for attempt in range(retry_count):
-                try:
-                    response = self.client.request_property_data_by_coordinates(
-                        coord["lat"], coord["lon"]
-                    )
-                    if response and 'request' in response:
-                        requests_data.append(response)
-                        logger.info(f"  Request ID: {response['request']['id']}")
-                        break  # Success, break out of retry loop
-                    else:
-                        logger.warning(f"  Failed to submit request for coordinates {coord}")
-                        if attempt < retry_count - 1:
-                            logger.info(f"  Retrying... (attempt {attempt + 2}/{retry_count})")
-                            time.sleep(2 ** attempt)  # Exponential backoff
-                except Exception as e:
-                    logger.error(f"  Error submitting request for coordinates {coord}: {e}")
+        Args:
+            index: Position of the coordinate in the input list
+            coord: Dictionary containing 'lat' and 'lon' keys
+            total: Total number of coordinates being submitted (for logging)
+            
+        Returns:
+            The response dictionary, or None if the request failed
+        """
+        logger.info(f"Submitting request {index+1}/{total} for coordinates {coord}")
+        retry_count = 3
+        for attempt in range(retry_count):
+            try:
+                response = self.client.request_property_data_by_coordinates(
+                    coord["lat"], coord["lon"]
+                )
+                if response and 'request' in response:
+                    logger.info(f"  Request ID: {response['request']['id']}")
+                    return response
+                else:
+                    logger.warning(f"  Failed to submit request for coordinates {coord}")
                     if attempt < retry_count - 1:
                         logger.info(f"  Retrying... (attempt {attempt + 2}/{retry_count})")
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                    else:
-                        logger.error(f"  Failed to submit request after {retry_count} attempts")
-        
-        return requests_data
+                        time.sleep(backoff_delay(attempt))
+            except Exception as e:
+                logger.error(f"  Error submitting request for coordinates {coord}: {e}")
+                if attempt < retry_count - 1:
+                    logger.info(f"  Retrying... (attempt {attempt + 2}/{retry_count})")
+                    time.sleep(backoff_delay(attempt))
+                else:
+                    logger.error(f"  Failed to submit request after {retry_count} attempts")
+        return None
     
     def save_requests_data(self, requests_data: List[Dict], output_dir: str = None) -> bool:
         """Save property data requests to a JSON file.
@@ -134,9 +194,5 @@ class PropertyDataService:
         Returns:
             A list of coordinate dictionaries with 'lat' and 'lon' keys
         """
-        # Bounding box: -96.00532698173473, 41.24140396772262, -95.97589954958912, 41.25672882015283
-        return [
-            {"lat": 41.25, "lon": -95.99},
-            {"lat": 41.245, "lon": -95.98},
-            {"lat": 41.255, "lon": -96.0}
-        ]
\ No newline at end of file
+        # Copy so callers can modify the result without touching the shared defaults
+        return [dict(coord) for coord in SANDBOX_COORDINATES]
\ No newline at end of file
@@ -4,13 +4,13 @@ Provides caching mechanisms to reduce API calls and improve performance.
 """
 
 import os
-import json
+import shutil
 import time
 import hashlib
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from functools import wraps
-from .file_ops import get_data_directory, ensure_directory_exists
+from .file_ops import dumps_json, get_data_directory, ensure_directory_exists, loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +30,12 @@ def generate_cache_key(func_name: str, *args, **kwargs) -> str:
     # Generate MD5 hash
     return hashlib.md5(combined.encode()).hexdigest()
 
-def cache_result(ttl_seconds: int = 3600):
+def cache_result(ttl_seconds: int = 3600, cache_if: Optional[Callable[[Any], bool]] = None):
     """Decorator to cache function results.
     
     Args:
         ttl_seconds: Time to live for cached results in seconds (default: 1 hour)
+        cache_if: Optional predicate; results it rejects are returned but not cached
     """
     def decorator(func):
         @wraps(func)
@@ -46,8 +47,8 @@ def cache_result(ttl_seconds: int = 3600):
             # Check if cached result exists and is still valid
             if os.path.exists(cache_file):
                 try:
-                    with open(cache_file, 'r') as f:
-                        cached_data = json.load(f)
+                    with open(cache_file, 'rb') as f:
+                        cached_data = loads_json(f.read())
                     
                     # Check if cache is still valid
                     if time.time() - cached_data['timestamp'] < ttl_seconds:
@@ -60,6 +61,8 @@ def cache_result(ttl_seconds: int = 3600):
             
             # Call the function and cache the result
             result = func(*args, **kwargs)
+            if cache_if is not None and not cache_if(result):
+                return result
             
             # Save result to cache
             try:
@@ -70,8 +73,8 @@ def cache_result(ttl_seconds: int = 3600):
                     'args': str(args),
                     'kwargs': str(kwargs)
                 }
-                with open(cache_file, 'w') as f:
-                    json.dump(cache_data, f, indent=2, default=str)
+                with open(cache_file, 'wb') as f:
+                    f.write(dumps_json(cache_data))
                 logger.info(f"Cached result for {func.__name__}")
             except Exception as e:
                 logger.warning(f"Error writing cache file {cache_file}: {e}")
@@ -84,7 +87,6 @@ def clear_cache():
     """Clear all cached data."""
     cache_dir = get_cache_directory()
     if os.path.exists(cache_dir):
-        import shutil
         shutil.rmtree(cache_dir)
         ensure_directory_exists(cache_dir)
         logger.info("Cache cleared")
\ No newline at end of file
@@ -10,12 +10,138 @@ a standardized logging setup function.
 import os
 import json
 import logging
-from typing import Dict, Any, Optional
+import mmap
+import logging.handlers
+from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib parser
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Buffer size for JSON file I/O; large enough that most files take one syscall
+IO_BUFFER_SIZE = 1 << 20
+
+# Rotation limits for the per-module log files
+LOG_FILE_MAX_BYTES = 50 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
+
+# Nonstandard media types servers still send, mapped to their registered names
+MEDIA_TYPE_ALIASES = {
+    'application/x-pdf': 'application/pdf',
+    'application/x-zip-compressed': 'application/zip',
+    'text/json': 'application/json',
+}
+
+def loads_json(data):
+    """Parse a JSON document from bytes or str.
+    
+    Uses orjson when it is installed and the standard library otherwise.
+    Both raise a json.JSONDecodeError subclass on invalid input.
+    
+    Args:
+        data: JSON document as bytes or str
+        
+    Returns:
+        The parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes.
+    
+    Uses orjson when it is installed and the standard library otherwise.
+    Values that are not JSON serializable are converted with str().
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+
+def dumps_json_line(data: Any) -> bytes:
+    """Serialize data as one compact JSON Lines record, newline included.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        The record as UTF-8 bytes ending in a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(data, separators=(',', ':'), default=str, ensure_ascii=False) + '\n').encode('utf-8')
+
+def load_json_lines(filepath: str) -> List[Any]:
+    """Load every record from a JSON Lines file, skipping blank lines.
+    
+    Args:
+        filepath: Path to the JSON Lines file
+        
+    Returns:
+        List of parsed records
+    """
+    with open(filepath, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        return [loads_json(line) for line in f if line.strip()]
+
+def extension_for_content_type(content_type: Optional[str], extensions: Dict[str, str],
+                               default: str) -> str:
+    """Map a Content-Type header value to a file extension.
+    
+    Parameters such as charset are stripped and the media type is lowercased
+    once, then looked up in the given table. A type missing from the table
+    falls back to its registered name (e.g. application/x-pdf) or to its
+    structured syntax suffix (e.g. application/vnd.api+json as JSON).
+    
+    Args:
+        content_type: Content-Type header value, possibly missing or carrying parameters
+        extensions: File extension for each lowercase media type
+        default: Extension used for media types not in the table
+        
+    Returns:
+        The file extension, including the leading dot
+    """
+    media_type = (content_type or '').partition(';')[0].strip().lower()
+    extension = extensions.get(media_type)
+    if extension is None and media_type in MEDIA_TYPE_ALIASES:
+        extension = extensions.get(MEDIA_TYPE_ALIASES[media_type])
+    if extension is None and '+' in media_type:
+        extension = extensions.get(f"application/{media_type.rpartition('+')[2]}")
+    return extension or default
+
+def read_json_file(filepath: str) -> Any:
+    """Read and parse a JSON file.
+    
+    With orjson installed the file is memory-mapped and parsed straight from
+    the mapping, so large files are never copied into an intermediate bytes
+    object. The standard library parser needs bytes, so it reads the file.
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        The parsed Python object
+    """
+    with open(filepath, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        if orjson is None or os.fstat(f.fileno()).st_size == 0:
+            return loads_json(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
 def ensure_directory_exists(directory: str) -> bool:
     """Ensure a directory exists, creating it if necessary.
     
@@ -28,6 +154,10 @@ def ensure_directory_exists(directory: str) -> bool:
     Returns:
         True if directory exists or was created successfully, False otherwise
     """
+    # A stat is far cheaper than a mkdir that fails with EEXIST, and this is
+    # called before every save
+    if os.path.isdir(directory):
+        return True
     try:
         Path(directory).mkdir(parents=True, exist_ok=True)
         return True
@@ -53,8 +183,10 @@ def save_json_data(data: Dict[Any, Any], filepath: str, create_dirs: bool = True
         if create_dirs:
             ensure_directory_exists(os.path.dirname(filepath))
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        # Serialize up front so the file is written in a single call
+        payload = dumps_json(data)
+        with open(filepath, 'wb') as f:
+            f.write(payload)
         logger.info(f"Data saved to: {filepath}")
         return True
     except Exception as e:
@@ -74,8 +206,7 @@ def load_json_data(filepath: str) -> Optional[Dict[Any, Any]]:
         Dictionary containing the loaded data, or None if loading failed
     """
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return read_json_file(filepath)
     except FileNotFoundError:
         logger.warning(f"File not found: {filepath}")
         return None
@@ -118,11 +249,12 @@ def resolve_project_path(relative_path: str) -> str:
     project_root = Path(__file__).parent.parent.parent
     return str(project_root / relative_path)
 
+@lru_cache(maxsize=None)
 def get_data_directory(subdirectory: str = "") -> str:
     """Get the full path to a data subdirectory.
     
-    This function returns the full path to a data subdirectory, creating the
-    data directory if it doesn't exist.
+    This function returns the full path to a data subdirectory. It does not
+    touch the filesystem, so each path is resolved once and then memoized.
     
     Args:
         subdirectory: Subdirectory within the data directory (optional)
@@ -168,7 +300,10 @@ def setup_logging(name: str, level: str = "INFO") -> logging.Logger:
         logs_dir = "logs"
         os.makedirs(logs_dir, exist_ok=True)  # Create logs directory if it doesn't exist
         log_file = os.path.join(logs_dir, f"{name.lower()}_{datetime.now().strftime('%Y%m%d')}.log")
-        file_handler = logging.FileHandler(log_file)
+        # delay=True defers opening the file until the first record is written
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT, delay=True
+        )
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
@@ -0,0 +1,84 @@
+"""
+Shared fixtures for the EagleView API client tests.
+Every HTTP call goes through a mocked requests.Session, so no test touches the network.
+"""
+
+import time
+from typing import Dict, Optional
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.eagleview.client import base
+from src.eagleview.config import create_config
+from src.eagleview.utils.file_ops import dumps_json
+
+
+class FakeClock:
+    """Stand-in for the time module whose sleeps advance a virtual clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_response(status_code: int = 200, json_body=None, content: bytes = b'',
+                  headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """Build a fully read requests.Response, usable as a streamed one too."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = dumps_json(json_body) if json_body is not None else content
+    response._content_consumed = True
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = 'https://example.test/'
+    return response
+
+
+def token_response(access_token: str) -> requests.Response:
+    """Response of a successful client credentials token request."""
+    return make_response(json_body={'access_token': access_token, 'expires_in': 3600})
+
+
+@pytest.fixture(autouse=True)
+def isolated_tokens(tmp_path, monkeypatch):
+    """Keep token files out of the repo and token state out of other tests."""
+    monkeypatch.chdir(tmp_path)
+    base._TOKEN_CACHE.clear()
+    yield
+    base._TOKEN_CACHE.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Virtual clock used by the client module."""
+    fake = FakeClock()
+    monkeypatch.setattr(base, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def settings():
+    """Sandbox settings with test credentials and a generous rate limit."""
+    return create_config('sandbox', client_id='test-client', client_secret='test-secret',
+                         requests_per_second=100, requests_per_minute=1000)
+
+
+@pytest.fixture
+def client(settings, clock) -> base.EagleViewClient:
+    """Client whose session is a mock and whose token request succeeds."""
+    client = base.EagleViewClient(settings)
+    client.session = MagicMock(spec=requests.Session)
+    client.session.post.return_value = token_response('token-1')
+    return client
@@ -0,0 +1,216 @@
+"""
+Tests for EagleViewClient rate limiting, authentication and report paging.
+"""
+
+import threading
+
+import pytest
+
+from conftest import make_response, token_response
+from src.eagleview.client import base, create_client
+
+
+def reports_page(report_ids, total):
+    """GetReports response body for one page."""
+    return make_response(json_body=[{'ReportList': [{'Id': report_id} for report_id in report_ids],
+                                     'TotalOfReports': total}])
+
+
+class TestRateLimit:
+    """Token bucket, per-minute window and server-requested pauses."""
+
+    def test_burst_of_one_then_paced_per_second(self, settings, clock):
+        settings.requests_per_second = 2
+        client = base.EagleViewClient(settings)
+
+        for _ in range(3):
+            client._rate_limit()
+
+        assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+    def test_idle_time_refills_the_bucket(self, settings, clock):
+        settings.requests_per_second = 2
+        client = base.EagleViewClient(settings)
+
+        client._rate_limit()
+        clock.now += 1
+        client._rate_limit()
+
+        assert clock.sleeps == []
+
+    def test_per_minute_window(self, settings, clock):
+        settings.requests_per_minute = 3
+        client = base.EagleViewClient(settings)
+
+        for _ in range(3):
+            client._rate_limit()
+            clock.now += 1
+        client._rate_limit()
+
+        assert clock.sleeps == [pytest.approx(57)]
+
+    def test_per_minute_limit_from_float_setting(self, settings, clock):
+        # YAML configs can give the limit as a float
+        settings.requests_per_minute = 3.0
+        client = base.EagleViewClient(settings)
+
+        for _ in range(3):
+            client._rate_limit()
+            clock.now += 1
+        client._rate_limit()
+
+        assert clock.sleeps == [pytest.approx(57)]
+
+    def test_server_quota_pauses_next_request(self, settings, clock):
+        client = base.EagleViewClient(settings)
+
+        client._note_rate_limit_headers(make_response(headers={'RateLimit-Remaining': '0',
+                                                               'RateLimit-Reset': '5'}))
+        client._rate_limit()
+
+        assert clock.sleeps == [pytest.approx(5)]
+
+    def test_server_pause_is_capped(self, settings, clock):
+        client = base.EagleViewClient(settings)
+
+        client._note_rate_limit_headers(make_response(headers={'RateLimit-Remaining': '0',
+                                                               'RateLimit-Reset': '3600'}))
+        client._rate_limit()
+
+        assert clock.sleeps == [pytest.approx(base.MAX_BACKOFF_SECONDS)]
+
+
+class TestAuthentication:
+    """Token refresh and sharing between clients."""
+
+    def test_401_refreshes_token_once_and_resends(self, client):
+        client.session.post.side_effect = [token_response('token-1'), token_response('token-2')]
+        client.session.request.side_effect = [make_response(401), make_response(200, json_body={})]
+
+        response = client.make_request('GET', '/v1/test')
+
+        assert response.status_code == 200
+        assert client.session.post.call_count == 2
+        sent_tokens = [call.kwargs['headers']['Authorization']
+                       for call in client.session.request.call_args_list]
+        assert sent_tokens == ['Bearer token-1', 'Bearer token-2']
+
+    def test_concurrent_callers_share_one_token_request(self, client):
+        tokens = []
+        threads = [threading.Thread(target=lambda: tokens.append(client.get_access_token()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tokens == ['token-1'] * 8
+        assert client.session.post.call_count == 1
+
+    def test_clients_in_one_process_share_the_token(self, client, settings):
+        client.get_access_token()
+
+        other = base.EagleViewClient(settings)
+
+        assert other.access_token == 'token-1'
+        assert not other._is_token_expired()
+
+    def test_token_cleared_after_the_expiry_check_is_not_returned_as_none(self, settings, clock):
+        class InvalidatedAfterFirstRead(base.EagleViewClient):
+            """Client whose token is cleared by another thread right after it is read."""
+
+            @property
+            def access_token(self):
+                token, self._token = self._token, None
+                return token
+
+            @access_token.setter
+            def access_token(self, token):
+                self._token = token
+
+        client = InvalidatedAfterFirstRead(settings)
+        client.access_token = 'token-1'
+        client.token_expires_at = clock.time() + 3600
+
+        assert client.get_access_token() == 'token-1'
+
+    def test_invalidate_ignores_an_already_replaced_token(self, client):
+        client.get_access_token()
+
+        client._invalidate_token('stale-token')
+
+        assert client.access_token == 'token-1'
+
+    def test_create_client_builds_a_client_per_call(self, settings):
+        first = create_client(settings)
+        second = create_client(settings)
+
+        assert isinstance(first, base.EagleViewClient)
+        assert first is not second
+
+
+class TestOpenImage:
+    """Image requests go through make_request."""
+
+    def test_requests_image_from_imagery_base_url(self, client):
+        client.session.request.return_value = make_response(200, content=b'png')
+
+        with client.open_image('abc123') as response:
+            assert response.content == b'png'
+
+        method, url = client.session.request.call_args.args
+        kwargs = client.session.request.call_args.kwargs
+        assert (method, url) == ('GET', f'{client.imagery_base_url}/property/v2/image/abc123')
+        assert kwargs['stream'] is True
+        assert kwargs['headers']['Accept'] == 'image/png'
+        assert kwargs['headers']['Authorization'] == 'Bearer token-1'
+
+
+class TestReportPaging:
+    """Concurrent report pagination."""
+
+    def test_pages_are_yielded_in_order(self, client):
+        pages = {1: reports_page(range(0, 100), 250), 2: reports_page(range(100, 200), 250),
+                 3: reports_page(range(200, 250), 250)}
+        client.session.request.side_effect = lambda method, url, **kwargs: pages[kwargs['params']['page']]
+
+        report_pages = list(client.iter_customer_report_pages())
+
+        assert [[report['Id'] for report in page] for page in report_pages] == [
+            list(range(0, 100)), list(range(100, 200)), list(range(200, 250))]
+
+    def test_single_page_makes_one_request(self, client):
+        client.session.request.return_value = reports_page(range(3), 3)
+
+        assert list(client.iter_customer_report_pages()) == [[{'Id': 0}, {'Id': 1}, {'Id': 2}]]
+        assert client.session.request.call_count == 1
+
+    def test_closing_early_cancels_pending_pages(self, client, settings):
+        # Two workers; later pages block until the consumer has stopped reading
+        settings.requests_per_second = 2
+        release = threading.Event()
+
+        def respond(method, url, **kwargs):
+            page = kwargs['params']['page']
+            if page > 2:
+                release.wait(timeout=5)
+            return reports_page(range((page - 1) * 100, page * 100), 10000)
+
+        client.session.request.side_effect = respond
+
+        pages = client.iter_customer_report_pages()
+        next(pages)
+        next(pages)
+        threading.Timer(0.2, release.set).start()
+        pages.close()
+
+        # Pages 1 and 2 plus at most the two that were in flight, out of 100
+        assert client.session.request.call_count <= 4
+
+    def test_get_all_customer_reports_collects_every_page(self, client):
+        pages = {1: reports_page(range(0, 100), 150), 2: reports_page(range(100, 150), 150)}
+        client.session.request.side_effect = lambda method, url, **kwargs: pages[kwargs['params']['page']]
+
+        reports = client.get_all_customer_reports(save_to_csv=False)
+
+        assert [report['Id'] for report in reports] == list(range(150))
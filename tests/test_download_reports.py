@@ -0,0 +1,88 @@
+"""
+Tests for the report download script: skipping finished files and the JSON Lines summary.
+"""
+
+import hashlib
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from conftest import make_response
+from scripts import download_reports
+from scripts.download_reports import DownloadSummary, download_report_file
+from src.eagleview.utils.file_ops import load_json_lines
+
+REPORT_BYTES = b'%PDF-1.7 report body'
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    """Client whose report file requests all return the same PDF."""
+    client = MagicMock()
+    client.open_report_file.side_effect = lambda *args: make_response(
+        content=REPORT_BYTES, headers={'Content-Type': 'application/pdf'})
+    return client
+
+
+def test_download_writes_file_and_summary(client, tmp_path):
+    summary = DownloadSummary(str(tmp_path / 'summary.jsonl'))
+
+    assert download_report_file(client, 42, output_dir=str(tmp_path), summary=summary)
+    summary.close()
+
+    assert (tmp_path / 'report_42.pdf').read_bytes() == REPORT_BYTES
+    assert not (tmp_path / 'report_42.pdf.part').exists()
+    [entry] = load_json_lines(summary.path)
+    assert entry['report_id'] == 42
+    assert entry['filename'] == 'report_42.pdf'
+    assert entry['size_bytes'] == len(REPORT_BYTES)
+    assert entry['sha256'] == hashlib.sha256(REPORT_BYTES).hexdigest()
+
+
+def test_existing_file_is_skipped_without_a_request(client, tmp_path):
+    (tmp_path / 'report_42.pdf').write_bytes(REPORT_BYTES)
+
+    assert download_report_file(client, 42, output_dir=str(tmp_path))
+    client.open_report_file.assert_not_called()
+
+
+def test_unfinished_part_file_is_downloaded_again(client, tmp_path):
+    (tmp_path / 'report_42.pdf.part').write_bytes(REPORT_BYTES[:5])
+
+    assert download_report_file(client, 42, output_dir=str(tmp_path))
+    assert client.open_report_file.call_count == 1
+    assert (tmp_path / 'report_42.pdf').read_bytes() == REPORT_BYTES
+
+
+def test_failed_download_leaves_no_file(client, tmp_path):
+    client.open_report_file.side_effect = lambda *args: make_response(500, content=b'error')
+
+    assert not download_report_file(client, 42, output_dir=str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_summary_file_is_created_only_when_written(tmp_path):
+    summary = DownloadSummary(str(tmp_path / 'summary.jsonl'))
+    summary.close()
+
+    assert not os.path.exists(summary.path)
+
+
+def test_main_downloads_each_listed_report_once(client, tmp_path, monkeypatch, capsys):
+    # Only the report ID is read, so unexpected shapes in other fields don't matter
+    odd_report = {'Id': 3, 'ReportStatus': 'Completed', 'ReportProducts': [], 'DatePlaced': 20240101}
+    client.iter_customer_report_pages.return_value = iter([[{'Id': 1}, {'Id': 2}],
+                                                           [{'reportId': 2}, odd_report]])
+    settings = MagicMock()
+    settings.validate.return_value = True
+    monkeypatch.setattr(download_reports.EagleViewSettings, 'from_environment', lambda: settings)
+    monkeypatch.setattr(download_reports, 'EagleViewClient', lambda settings: client)
+    monkeypatch.setattr(download_reports, 'get_data_directory', lambda subdirectory: str(tmp_path))
+
+    download_reports.main()
+
+    assert sorted(call.args[0] for call in client.open_report_file.call_args_list) == [1, 2, 3]
+    assert "Downloaded 3 out of 3 reports" in capsys.readouterr().out
+    [summary_file] = [name for name in os.listdir(tmp_path) if name.endswith('.jsonl')]
+    assert sorted(entry['report_id'] for entry in load_json_lines(tmp_path / summary_file)) == [1, 2, 3]
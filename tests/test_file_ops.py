@@ -0,0 +1,22 @@
+"""
+Tests for the file operation helpers.
+"""
+
+import pytest
+
+from scripts.download_reports import REPORT_EXTENSION_BY_TYPE
+from src.eagleview.utils.file_ops import extension_for_content_type
+
+
+@pytest.mark.parametrize('content_type, extension', [
+    ('application/pdf', '.pdf'),
+    ('Application/PDF; charset=binary', '.pdf'),
+    ('application/x-pdf', '.pdf'),
+    ('application/vnd.api+json', '.json'),
+    ('application/atom+xml; charset=utf-8', '.xml'),
+    ('application/x-zip-compressed', '.zip'),
+    ('application/octet-stream', '.dat'),
+    (None, '.dat'),
+])
+def test_report_extension_for_content_type(content_type, extension):
+    assert extension_for_content_type(content_type, REPORT_EXTENSION_BY_TYPE, '.dat') == extension
@@ -0,0 +1,75 @@
+"""
+Tests for the ImageryService in-memory response cache.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from conftest import FakeClock
+from src.eagleview.config.sandbox import SANDBOX_COORDINATES
+from src.eagleview.services.base import imagery_service
+from src.eagleview.services.base.imagery_service import ImageryService
+
+
+@pytest.fixture
+def imagery_clock(monkeypatch) -> FakeClock:
+    """Virtual clock used by the imagery service."""
+    fake = FakeClock()
+    monkeypatch.setattr(imagery_service, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def service(settings, imagery_clock) -> ImageryService:
+    """Imagery service whose client answers every location with a fresh dict."""
+    client = MagicMock()
+    client.settings = settings
+    client.get_imagery_for_location.side_effect = lambda request: {'request': request}
+    return ImageryService(client)
+
+
+LOCATION = SANDBOX_COORDINATES[0]
+OTHER_LOCATION = SANDBOX_COORDINATES[1]
+
+
+def request(service, location):
+    return service.request_imagery_for_location('test', location['lat'], location['lon'])
+
+
+def test_repeated_location_is_served_from_cache(service):
+    first = request(service, LOCATION)
+    second = request(service, LOCATION)
+
+    assert second is first
+    assert service.client.get_imagery_for_location.call_count == 1
+
+
+def test_cached_response_expires(service, imagery_clock):
+    request(service, LOCATION)
+    imagery_clock.now += imagery_service.IMAGERY_CACHE_TTL_SECONDS
+
+    request(service, LOCATION)
+
+    assert service.client.get_imagery_for_location.call_count == 2
+
+
+def test_least_recently_used_location_is_evicted(service, monkeypatch):
+    monkeypatch.setattr(imagery_service, 'IMAGERY_CACHE_SIZE', 1)
+
+    request(service, LOCATION)
+    request(service, OTHER_LOCATION)
+    request(service, OTHER_LOCATION)
+    request(service, LOCATION)
+
+    assert service.client.get_imagery_for_location.call_count == 3
+
+
+def test_empty_response_is_not_retried_or_cached(service, imagery_clock):
+    service.client.get_imagery_for_location.side_effect = None
+    service.client.get_imagery_for_location.return_value = {}
+
+    assert request(service, LOCATION) is None
+    assert request(service, LOCATION) is None
+    assert service.client.get_imagery_for_location.call_count == 2
+    assert imagery_clock.sleeps == []